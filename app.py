@@ -20,11 +20,12 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import functools
 import json
 import re
 from datetime import datetime, timedelta
 from collections import Counter
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 # Default paths (resolved from project root)
 DEFAULT_OCR_DIR = str(ROOT / "ocr" / "ocr_output")
@@ -48,21 +49,35 @@ _THEME_DEFAULTS = {
 
 
 def load_theme() -> dict:
-    """Load saved theme or return defaults."""
-    if THEME_FILE.exists():
-        try:
-            with open(THEME_FILE, "r") as f:
-                saved = json.load(f)
-            return {**_THEME_DEFAULTS, **saved}
-        except (json.JSONDecodeError, OSError):
-            pass
-    return dict(_THEME_DEFAULTS)
+    """Load saved theme or return defaults.
+
+    The app and several plugins call this on every rerun, so the parsed
+    file is cached on its modification time; unchanged reruns only stat it.
+    """
+    try:
+        mtime = THEME_FILE.stat().st_mtime_ns
+    except OSError:
+        return dict(_THEME_DEFAULTS)
+    return dict(_read_theme_file(mtime))
+
+
+@functools.lru_cache(maxsize=1)
+def _read_theme_file(mtime_ns: int) -> dict:
+    """Parse THEME_FILE over the defaults (*mtime_ns* is the cache key)."""
+    try:
+        with open(THEME_FILE, "r") as f:
+            saved = json.load(f)
+        return {**_THEME_DEFAULTS, **saved}
+    except (json.JSONDecodeError, OSError):
+        return dict(_THEME_DEFAULTS)
 
 
 def save_theme(theme: dict):
     """Persist the current theme to disk."""
     with open(THEME_FILE, "w") as f:
         json.dump(theme, f, indent=2)
+    # Coarse filesystem timestamps could let a quick re-save keep its mtime
+    _read_theme_file.cache_clear()
 
 
 def _inject_theme_css(t: dict):
@@ -182,11 +197,16 @@ def load_journal_data(ocr_output_dir: str) -> pd.DataFrame:
 # Helpers
 # ---------------------------------------------------------------------------
 
+@st.cache_resource
+def _get_sentiment_analyzer():
+    """Lazily import and instantiate VADER (cached so the lexicon loads once)."""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
 def get_sentiment(text: str) -> float:
     """VADER sentiment score (-1 to +1)."""
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-    analyzer = SentimentIntensityAnalyzer()
-    return analyzer.polarity_scores(text)["compound"]
+    return _get_sentiment_analyzer().polarity_scores(text)["compound"]
 
 
 @st.cache_data(show_spinner="Analyzing sentiment...")
@@ -195,7 +215,9 @@ def _add_sentiment(df: pd.DataFrame) -> pd.DataFrame:
     if "sentiment" in df.columns:
         return df
     df = df.copy()
-    df["sentiment"] = df["text"].apply(get_sentiment)
+    # One bound-method lookup for the whole column rather than per entry
+    polarity_scores = _get_sentiment_analyzer().polarity_scores
+    df["sentiment"] = [polarity_scores(text)["compound"] for text in df["text"]]
     return df
 
 
@@ -206,32 +228,51 @@ def section_header(title: str, help_text: str):
         st.markdown(help_text)
 
 
-def extract_common_words(texts: List[str], n_words: int = 30) -> List[Tuple[str, int]]:
-    """Extract most common meaningful words, filtering stop words."""
-    stop_words = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "were", "been", "be",
-        "have", "has", "had", "do", "does", "did", "will", "would", "could",
-        "should", "may", "might", "must", "can", "i", "me", "my", "mine",
-        "you", "your", "yours", "he", "him", "his", "she", "her", "hers",
-        "it", "its", "we", "us", "our", "ours", "they", "them", "their",
-        "theirs", "this", "that", "these", "those", "am", "are", "was",
-        "were", "been", "being", "have", "has", "had", "having", "do",
-        "does", "did", "doing", "just", "so", "than", "too", "very",
-        "about", "after", "again", "also", "back", "been", "before",
-        "being", "between", "both", "came", "come", "each", "even",
-        "every", "first", "get", "got", "into", "know", "like", "made",
-        "make", "many", "more", "most", "much", "need", "never", "next",
-        "now", "only", "other", "over", "part", "really", "right", "same",
-        "some", "still", "such", "take", "tell", "then", "there", "thing",
-        "think", "time", "want", "well", "went", "what", "when", "where",
-        "which", "while", "who", "will", "with", "work", "year",
-    }
-    all_words = []
+_STOP_WORDS = {
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "were", "been", "be",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "can", "i", "me", "my", "mine",
+    "you", "your", "yours", "he", "him", "his", "she", "her", "hers",
+    "it", "its", "we", "us", "our", "ours", "they", "them", "their",
+    "theirs", "this", "that", "these", "those", "am", "are", "was",
+    "were", "been", "being", "have", "has", "had", "having", "do",
+    "does", "did", "doing", "just", "so", "than", "too", "very",
+    "about", "after", "again", "also", "back", "been", "before",
+    "being", "between", "both", "came", "come", "each", "even",
+    "every", "first", "get", "got", "into", "know", "like", "made",
+    "make", "many", "more", "most", "much", "need", "never", "next",
+    "now", "only", "other", "over", "part", "really", "right", "same",
+    "some", "still", "such", "take", "tell", "then", "there", "thing",
+    "think", "time", "want", "well", "went", "what", "when", "where",
+    "which", "while", "who", "will", "with", "work", "year",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _count_words(texts: pd.Series) -> Counter:
+    """Counts of meaningful words across *texts*, cached per set of texts.
+
+    Taking a Series lets Streamlit key the cache with pandas' vectorised
+    hash instead of hashing every string one by one.
+    """
+    counts = Counter()
     for text in texts:
         words = re.findall(r"\b\w+\b", text.lower())
-        all_words.extend(w for w in words if w not in stop_words and len(w) > 3)
-    return Counter(all_words).most_common(n_words)
+        counts.update(w for w in words if w not in _STOP_WORDS and len(w) > 3)
+    return counts
+
+
+def extract_common_words(texts: Iterable[str], n_words: int = 30) -> List[Tuple[str, int]]:
+    """Extract most common meaningful words, filtering stop words.
+
+    *texts* can be any iterable of strings, e.g. a DataFrame column.
+    The counting pass is cached, so asking for a different *n_words*
+    (e.g. from a slider) doesn't rescan the text.
+    """
+    if not isinstance(texts, pd.Series):
+        texts = pd.Series(list(texts), dtype=object)
+    return _count_words(texts).most_common(n_words)
 
 
 @st.cache_resource
@@ -547,7 +588,7 @@ def tab_words(df: pd.DataFrame):
     col1, col2 = st.columns([2, 1])
     with col1:
         n_words = st.slider("Number of words to show", 10, 50, 30)
-        common = extract_common_words(df["text"].tolist(), n_words=n_words)
+        common = extract_common_words(df["text"], n_words=n_words)
         if common:
             words_df = pd.DataFrame(common, columns=["Word", "Count"])
             fig = px.bar(words_df, x="Count", y="Word", orientation="h",
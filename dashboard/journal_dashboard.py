@@ -127,6 +127,205 @@ def extract_common_words(texts: List[str], n_words: int = 30) -> List[Tuple[str,
     return Counter(all_words).most_common(n_words)
 
 
+_THEME_DEFAULTS = {
+    "body_font": "Georgia",
+    "heading_font": "Garamond",
+    "font_size": 16,
+    "line_height": 1.6,
+    "text_color": "#262730",
+    "heading_color": "#0f0f23",
+    "link_color": "#636EFA",
+    "metric_color": "#1a1a2e",
+    "bg_color": "#ffffff",
+    "sidebar_bg": "#f8f9fa",
+    "content_padding": 1.0,
+    "block_gap": 1.5,
+    "metric_font_size": 14,
+    "border_radius": 8,
+}
+
+_THEME_PRESETS = {
+    "🌙 Dark Ink": {
+        "body_font": "Georgia",
+        "heading_font": "Garamond",
+        "font_size": 16,
+        "line_height": 1.7,
+        "text_color": "#e8e8e0",
+        "heading_color": "#f5f0e8",
+        "link_color": "#c9a96e",
+        "metric_color": "#c9a96e",
+        "bg_color": "#1a1814",
+        "sidebar_bg": "#12100e",
+        "content_padding": 1.5,
+        "block_gap": 2.0,
+        "metric_font_size": 13,
+        "border_radius": 6,
+    },
+    "📜 Parchment": {
+        "body_font": "Palatino Linotype",
+        "heading_font": "Garamond",
+        "font_size": 17,
+        "line_height": 1.8,
+        "text_color": "#3b2f1e",
+        "heading_color": "#1e1208",
+        "link_color": "#7a4f2e",
+        "metric_color": "#4a3220",
+        "bg_color": "#fdf6e3",
+        "sidebar_bg": "#f5e8c8",
+        "content_padding": 2.0,
+        "block_gap": 2.0,
+        "metric_font_size": 14,
+        "border_radius": 4,
+    },
+    "🧊 Minimal": {
+        "body_font": "sans-serif",
+        "heading_font": "sans-serif",
+        "font_size": 15,
+        "line_height": 1.5,
+        "text_color": "#111111",
+        "heading_color": "#000000",
+        "link_color": "#0066cc",
+        "metric_color": "#0066cc",
+        "bg_color": "#ffffff",
+        "sidebar_bg": "#f4f4f4",
+        "content_padding": 1.0,
+        "block_gap": 1.5,
+        "metric_font_size": 12,
+        "border_radius": 2,
+    },
+    "🌿 Sage": {
+        "body_font": "Georgia",
+        "heading_font": "Georgia",
+        "font_size": 16,
+        "line_height": 1.7,
+        "text_color": "#2d3a2e",
+        "heading_color": "#1a2e1b",
+        "link_color": "#4a7c59",
+        "metric_color": "#3a6648",
+        "bg_color": "#f4f8f4",
+        "sidebar_bg": "#e8f0e8",
+        "content_padding": 1.5,
+        "block_gap": 1.75,
+        "metric_font_size": 14,
+        "border_radius": 10,
+    },
+}
+
+
+def _apply_preset(name: str):
+    """Button callback: load a preset into the Appearance widgets' session state."""
+    st.session_state.update(_THEME_PRESETS[name])
+
+
+# CSS / preview templates for the Appearance tab, filled via str.format_map
+# with a style dict (keys as in _THEME_DEFAULTS, plus half_block_gap)
+_CSS_FMT = """
+<style>
+/* ── Base ── */
+html, body, [class*="css"] {{
+    font-family: '{body_font}', serif !important;
+    font-size: {font_size}px !important;
+    line-height: {line_height} !important;
+    color: {text_color} !important;
+    background-color: {bg_color} !important;
+}}
+
+/* ── Headings ── */
+h1, h2, h3, h4, h5, h6,
+.stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {{
+    font-family: '{heading_font}', serif !important;
+    color: {heading_color} !important;
+}}
+
+/* ── Links ── */
+a, a:visited {{
+    color: {link_color} !important;
+}}
+
+/* ── Metrics ── */
+[data-testid="stMetricValue"] {{
+    color: {metric_color} !important;
+    font-family: '{heading_font}', serif !important;
+}}
+[data-testid="stMetricLabel"] {{
+    font-size: {metric_font_size}px !important;
+    color: {text_color} !important;
+    opacity: 0.75;
+}}
+
+/* ── Sidebar ── */
+[data-testid="stSidebar"] {{
+    background-color: {sidebar_bg} !important;
+}}
+[data-testid="stSidebar"] * {{
+    color: {text_color} !important;
+}}
+
+/* ── Main content padding ── */
+.block-container {{
+    padding-left: {content_padding}rem !important;
+    padding-right: {content_padding}rem !important;
+}}
+
+/* ── Section gaps ── */
+.element-container {{
+    margin-bottom: {half_block_gap}rem !important;
+}}
+
+/* ── Expanders / cards ── */
+[data-testid="stExpander"] {{
+    border-radius: {border_radius}px !important;
+}}
+
+/* ── Tabs ── */
+[data-baseweb="tab-list"] {{
+    font-family: '{body_font}', serif !important;
+}}
+</style>
+"""
+
+_PREVIEW_FMT = """
+<div style="
+    font-family: '{body_font}', serif;
+    font-size: {font_size}px;
+    line-height: {line_height};
+    color: {text_color};
+    background-color: {bg_color};
+    padding: 1.5rem;
+    border-radius: {border_radius}px;
+    border: 1px solid #ddd;
+">
+  <h2 style="font-family: '{heading_font}', serif; color: {heading_color}; margin-top: 0;">
+    📔 Journal Entry — March 12
+  </h2>
+  <p>
+    Today was one of those slow, contemplative days where the light came in sideways through the
+    blinds and everything felt like it was happening just slightly underwater. I wrote for an hour
+    and a half without looking up.
+  </p>
+  <p>
+    <a href="#" style="color: {link_color};">View full entry →</a>
+  </p>
+  <hr style="border-color: {link_color}; opacity: 0.3;" />
+  <p style="font-size: {metric_font_size}px; opacity: 0.7;">
+    Words: 412 &nbsp;·&nbsp; Sentiment: +0.42 &nbsp;·&nbsp; Streak: 14 days
+  </p>
+</div>
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _build_css(style: dict) -> str:
+    """Build the Appearance tab CSS for a style dict."""
+    return _CSS_FMT.format_map({**style, "half_block_gap": style["block_gap"] / 2})
+
+
+@st.cache_data(show_spinner=False)
+def _build_preview_html(style: dict) -> str:
+    """Build the Live Preview card HTML for a style dict."""
+    return _PREVIEW_FMT.format_map(style)
+
+
 def main():
     st.title("📔 Journal Analytics Dashboard")
     
@@ -663,13 +862,21 @@ def main():
             injected CSS and take effect across the whole page.
         """)
 
+        # Widget values live in session state (keyed by style name) so the
+        # preset buttons below can overwrite them from a callback
+        for name, value in _THEME_DEFAULTS.items():
+            if name not in st.session_state:
+                st.session_state[name] = value
+
         # ── Font settings ──────────────────────────────────────────────
         st.subheader("🔤 Typography")
 
+        style = {}
+
         font_col1, font_col2 = st.columns(2)
 
         with font_col1:
-            body_font = st.selectbox(
+            style["body_font"] = st.selectbox(
                 "Body font",
                 options=[
                     "Georgia",
@@ -681,14 +888,14 @@ def main():
                     "sans-serif",
                     "monospace",
                 ],
-                index=0,
+                key="body_font",
                 help="Font used for body text and general content",
             )
 
-            font_size = st.slider("Base font size (px)", min_value=12, max_value=22, value=16)
+            style["font_size"] = st.slider("Base font size (px)", min_value=12, max_value=22, key="font_size")
 
         with font_col2:
-            heading_font = st.selectbox(
+            style["heading_font"] = st.selectbox(
                 "Heading font",
                 options=[
                     "Georgia",
@@ -700,11 +907,11 @@ def main():
                     "serif",
                     "sans-serif",
                 ],
-                index=2,
+                key="heading_font",
                 help="Font used for h1–h3 headings",
             )
 
-            line_height = st.slider("Line height", min_value=1.2, max_value=2.2, value=1.6, step=0.1)
+            style["line_height"] = st.slider("Line height", min_value=1.2, max_value=2.2, step=0.1, key="line_height")
 
         # ── Colour settings ────────────────────────────────────────────
         st.subheader("🖌️ Colours")
@@ -712,16 +919,16 @@ def main():
         colour_col1, colour_col2, colour_col3 = st.columns(3)
 
         with colour_col1:
-            text_color = st.color_picker("Body text colour", value="#262730")
-            heading_color = st.color_picker("Heading colour", value="#0f0f23")
+            style["text_color"] = st.color_picker("Body text colour", key="text_color")
+            style["heading_color"] = st.color_picker("Heading colour", key="heading_color")
 
         with colour_col2:
-            link_color = st.color_picker("Link / accent colour", value="#636EFA")
-            metric_color = st.color_picker("Metric value colour", value="#1a1a2e")
+            style["link_color"] = st.color_picker("Link / accent colour", key="link_color")
+            style["metric_color"] = st.color_picker("Metric value colour", key="metric_color")
 
         with colour_col3:
-            bg_color = st.color_picker("Page background", value="#ffffff")
-            sidebar_bg = st.color_picker("Sidebar background", value="#f8f9fa")
+            style["bg_color"] = st.color_picker("Page background", key="bg_color")
+            style["sidebar_bg"] = st.color_picker("Sidebar background", key="sidebar_bg")
 
         # ── Spacing & layout ───────────────────────────────────────────
         st.subheader("📐 Spacing & Layout")
@@ -729,12 +936,12 @@ def main():
         spacing_col1, spacing_col2 = st.columns(2)
 
         with spacing_col1:
-            content_padding = st.slider("Content horizontal padding (rem)", 0.5, 4.0, 1.0, step=0.25)
-            block_gap = st.slider("Gap between sections (rem)", 0.5, 4.0, 1.5, step=0.25)
+            style["content_padding"] = st.slider("Content horizontal padding (rem)", 0.5, 4.0, step=0.25, key="content_padding")
+            style["block_gap"] = st.slider("Gap between sections (rem)", 0.5, 4.0, step=0.25, key="block_gap")
 
         with spacing_col2:
-            metric_font_size = st.slider("Metric label size (px)", 10, 18, 14)
-            border_radius = st.slider("Card / expander border radius (px)", 0, 20, 8)
+            style["metric_font_size"] = st.slider("Metric label size (px)", 10, 18, key="metric_font_size")
+            style["border_radius"] = st.slider("Card / expander border radius (px)", 0, 20, key="border_radius")
 
         # ── Presets ────────────────────────────────────────────────────
         st.subheader("✨ Quick Presets")
@@ -742,205 +949,23 @@ def main():
 
         preset_cols = st.columns(4)
 
-        presets = {
-            "🌙 Dark Ink": {
-                "body_font": "Georgia",
-                "heading_font": "Garamond",
-                "font_size": 16,
-                "line_height": 1.7,
-                "text_color": "#e8e8e0",
-                "heading_color": "#f5f0e8",
-                "link_color": "#c9a96e",
-                "metric_color": "#c9a96e",
-                "bg_color": "#1a1814",
-                "sidebar_bg": "#12100e",
-                "content_padding": 1.5,
-                "block_gap": 2.0,
-                "metric_font_size": 13,
-                "border_radius": 6,
-            },
-            "📜 Parchment": {
-                "body_font": "Palatino Linotype",
-                "heading_font": "Garamond",
-                "font_size": 17,
-                "line_height": 1.8,
-                "text_color": "#3b2f1e",
-                "heading_color": "#1e1208",
-                "link_color": "#7a4f2e",
-                "metric_color": "#4a3220",
-                "bg_color": "#fdf6e3",
-                "sidebar_bg": "#f5e8c8",
-                "content_padding": 2.0,
-                "block_gap": 2.0,
-                "metric_font_size": 14,
-                "border_radius": 4,
-            },
-            "🧊 Minimal": {
-                "body_font": "sans-serif",
-                "heading_font": "sans-serif",
-                "font_size": 15,
-                "line_height": 1.5,
-                "text_color": "#111111",
-                "heading_color": "#000000",
-                "link_color": "#0066cc",
-                "metric_color": "#0066cc",
-                "bg_color": "#ffffff",
-                "sidebar_bg": "#f4f4f4",
-                "content_padding": 1.0,
-                "block_gap": 1.5,
-                "metric_font_size": 12,
-                "border_radius": 2,
-            },
-            "🌿 Sage": {
-                "body_font": "Georgia",
-                "heading_font": "Georgia",
-                "font_size": 16,
-                "line_height": 1.7,
-                "text_color": "#2d3a2e",
-                "heading_color": "#1a2e1b",
-                "link_color": "#4a7c59",
-                "metric_color": "#3a6648",
-                "bg_color": "#f4f8f4",
-                "sidebar_bg": "#e8f0e8",
-                "content_padding": 1.5,
-                "block_gap": 1.75,
-                "metric_font_size": 14,
-                "border_radius": 10,
-            },
-        }
-
-        chosen_preset = None
-        for i, (label, _) in enumerate(presets.items()):
-            with preset_cols[i]:
-                if st.button(label, use_container_width=True):
-                    chosen_preset = label
-
-        if chosen_preset:
-            p = presets[chosen_preset]
-            st.info(
-                f"**{chosen_preset}** selected! Reload the tab or re-run to apply preset values "
-                f"(Streamlit requires a rerun to push new widget defaults). "
-                f"The CSS preview below already reflects the preset."
-            )
-            # Override locals for CSS generation with preset values
-            body_font      = p["body_font"]
-            heading_font   = p["heading_font"]
-            font_size      = p["font_size"]
-            line_height    = p["line_height"]
-            text_color     = p["text_color"]
-            heading_color  = p["heading_color"]
-            link_color     = p["link_color"]
-            metric_color   = p["metric_color"]
-            bg_color       = p["bg_color"]
-            sidebar_bg     = p["sidebar_bg"]
-            content_padding = p["content_padding"]
-            block_gap      = p["block_gap"]
-            metric_font_size = p["metric_font_size"]
-            border_radius  = p["border_radius"]
+        for col, label in zip(preset_cols, _THEME_PRESETS):
+            with col:
+                st.button(label, on_click=_apply_preset, args=(label,),
+                          use_container_width=True)
 
         # ── Generate & inject CSS ──────────────────────────────────────
-        custom_css = f"""
-<style>
-/* ── Base ── */
-html, body, [class*="css"] {{
-    font-family: '{body_font}', serif !important;
-    font-size: {font_size}px !important;
-    line-height: {line_height} !important;
-    color: {text_color} !important;
-    background-color: {bg_color} !important;
-}}
-
-/* ── Headings ── */
-h1, h2, h3, h4, h5, h6,
-.stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {{
-    font-family: '{heading_font}', serif !important;
-    color: {heading_color} !important;
-}}
-
-/* ── Links ── */
-a, a:visited {{
-    color: {link_color} !important;
-}}
-
-/* ── Metrics ── */
-[data-testid="stMetricValue"] {{
-    color: {metric_color} !important;
-    font-family: '{heading_font}', serif !important;
-}}
-[data-testid="stMetricLabel"] {{
-    font-size: {metric_font_size}px !important;
-    color: {text_color} !important;
-    opacity: 0.75;
-}}
-
-/* ── Sidebar ── */
-[data-testid="stSidebar"] {{
-    background-color: {sidebar_bg} !important;
-}}
-[data-testid="stSidebar"] * {{
-    color: {text_color} !important;
-}}
-
-/* ── Main content padding ── */
-.block-container {{
-    padding-left: {content_padding}rem !important;
-    padding-right: {content_padding}rem !important;
-}}
-
-/* ── Section gaps ── */
-.element-container {{
-    margin-bottom: {block_gap / 2}rem !important;
-}}
-
-/* ── Expanders / cards ── */
-[data-testid="stExpander"] {{
-    border-radius: {border_radius}px !important;
-}}
-
-/* ── Tabs ── */
-[data-baseweb="tab-list"] {{
-    font-family: '{body_font}', serif !important;
-}}
-</style>
-"""
-
+        # The strings are cached per style, so reruns triggered by
+        # unrelated widgets reuse them. They still have to be emitted on
+        # every rerun: Streamlit drops elements a script run doesn't repeat.
+        custom_css = _build_css(style)
         st.markdown(custom_css, unsafe_allow_html=True)
 
         # ── CSS preview ────────────────────────────────────────────────
         st.subheader("👁️ Live Preview")
 
         with st.container():
-            st.markdown(
-                f"""
-<div style="
-    font-family: '{body_font}', serif;
-    font-size: {font_size}px;
-    line-height: {line_height};
-    color: {text_color};
-    background-color: {bg_color};
-    padding: 1.5rem;
-    border-radius: {border_radius}px;
-    border: 1px solid #ddd;
-">
-  <h2 style="font-family: '{heading_font}', serif; color: {heading_color}; margin-top: 0;">
-    📔 Journal Entry — March 12
-  </h2>
-  <p>
-    Today was one of those slow, contemplative days where the light came in sideways through the
-    blinds and everything felt like it was happening just slightly underwater. I wrote for an hour
-    and a half without looking up.
-  </p>
-  <p>
-    <a href="#" style="color: {link_color};">View full entry →</a>
-  </p>
-  <hr style="border-color: {link_color}; opacity: 0.3;" />
-  <p style="font-size: {metric_font_size}px; opacity: 0.7;">
-    Words: 412 &nbsp;·&nbsp; Sentiment: +0.42 &nbsp;·&nbsp; Streak: 14 days
-  </p>
-</div>
-""",
-                unsafe_allow_html=True,
-            )
+            st.markdown(_build_preview_html(style), unsafe_allow_html=True)
 
         # ── Export CSS snippet ─────────────────────────────────────────
         st.subheader("📋 Export CSS")
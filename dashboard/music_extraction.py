@@ -5,9 +5,79 @@ Identifies songs mentioned in journal entries and links them on iTunes/Apple Mus
 """
 
 import re
-import requests
-from typing import List, Dict, Optional
-from urllib.parse import quote
+from typing import List, Dict, Optional, Tuple
+
+ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
+
+# Cap on simultaneous iTunes requests (keeps us polite to Apple's rate limits)
+MAX_CONCURRENT_LOOKUPS = 16
+
+
+# Mention patterns, compiled once at import
+# 1: "Song Title" by Artist Name
+_PAT_QUOTED_BY = re.compile(r'"([^"]+)"\s+by\s+([^,.\n]+)', re.IGNORECASE)
+# 2: listened to "Song Title"
+_PAT_LISTENED_TO = re.compile(r'listened?\s+to\s+"([^"]+)"', re.IGNORECASE)
+# 3: Song: "Title" or song called "Title"
+_PAT_SONG_COLON = re.compile(r'song\s+(?:called\s+|:)?"([^"]+)"', re.IGNORECASE)
+# 4: Artist - Song Title (common in playlists)
+_PAT_DASH_FORMAT = re.compile(r'([A-Z][A-Za-z\s&]+)\s+-\s+([A-Z][^,.\n]+)')
+# 5: Listening to Artist
+_PAT_LISTENING_ARTIST = re.compile(
+    r'listening\s+to\s+([A-Z][A-Za-z\s&]+?)(?:\s+today|\s+now|\s+all|,|\.|$)',
+    re.IGNORECASE,
+)
+
+
+# Noise stripped before comparing song/artist names: "(feat. X)", "[Live]",
+# and punctuation other than "&" and "-"
+_NORMALIZE_NOISE = re.compile(r'\(feat[^)]*\)|\[.*?\]|[^\w\s&\-]', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize(name: str) -> str:
+    """Normalize a song or artist name so equivalent mentions share a key."""
+    return _WHITESPACE.sub(' ', _NORMALIZE_NOISE.sub('', name)).strip().lower()
+
+
+def _extract_mention_tuples(text: str) -> List[Tuple[str, str, str]]:
+    """
+    Core of extract_song_mentions(), returning lightweight
+    (song, artist, pattern) tuples instead of one dict per match.
+    """
+    mentions = []
+    
+    mentions.extend(
+        (song.strip(), artist.strip(), 'quoted_by')
+        for song, artist in _PAT_QUOTED_BY.findall(text)
+    )
+    mentions.extend(
+        (song.strip(), '', 'listened_to')
+        for song in _PAT_LISTENED_TO.findall(text)
+    )
+    mentions.extend(
+        (song.strip(), '', 'song_colon')
+        for song in _PAT_SONG_COLON.findall(text)
+    )
+    # Filter out non-music dash patterns (e.g., dates, locations)
+    mentions.extend(
+        (song.strip(), artist.strip(), 'dash_format')
+        for artist, song in _PAT_DASH_FORMAT.findall(text)
+        if len(artist.split()) <= 4 and len(song.split()) <= 8
+    )
+    mentions.extend(
+        ('', artist.strip(), 'listening_artist')
+        for artist in _PAT_LISTENING_ARTIST.findall(text)
+        if len(artist.split()) <= 4
+    )
+    
+    return mentions
+
+
+def _to_dict(mention: Tuple[str, str, str]) -> Dict[str, str]:
+    """Convert a (song, artist, pattern) tuple to the public mention dict."""
+    song, artist, pattern = mention
+    return {'song': song, 'artist': artist, 'pattern': pattern}
 
 
 def extract_song_mentions(text: str) -> List[Dict[str, str]]:
@@ -26,62 +96,25 @@ def extract_song_mentions(text: str) -> List[Dict[str, str]]:
     Returns:
         List of dicts with 'song' and 'artist' keys
     """
-    mentions = []
-    
-    # Pattern 1: "Song Title" by Artist Name
-    pattern1 = r'"([^"]+)"\s+by\s+([^,.\n]+)'
-    matches1 = re.findall(pattern1, text, re.IGNORECASE)
-    for song, artist in matches1:
-        mentions.append({
-            'song': song.strip(),
-            'artist': artist.strip(),
-            'pattern': 'quoted_by'
-        })
-    
-    # Pattern 2: listened to "Song Title"
-    pattern2 = r'listened?\s+to\s+"([^"]+)"'
-    matches2 = re.findall(pattern2, text, re.IGNORECASE)
-    for song in matches2:
-        mentions.append({
-            'song': song.strip(),
-            'artist': '',
-            'pattern': 'listened_to'
-        })
-    
-    # Pattern 3: Song: "Title" or song called "Title"
-    pattern3 = r'song\s+(?:called\s+|:)?"([^"]+)"'
-    matches3 = re.findall(pattern3, text, re.IGNORECASE)
-    for song in matches3:
-        mentions.append({
-            'song': song.strip(),
-            'artist': '',
-            'pattern': 'song_colon'
+    return [_to_dict(m) for m in _extract_mention_tuples(text)]
+
+
+def _parse_itunes_results(data: Dict) -> List[Dict]:
+    """Convert a raw iTunes search response into our song metadata dicts."""
+    results = []
+    for item in data.get('results', []):
+        results.append({
+            'song_name': item.get('trackName', ''),
+            'artist_name': item.get('artistName', ''),
+            'album_name': item.get('collectionName', ''),
+            'artwork_url': item.get('artworkUrl100', '').replace('100x100', '300x300'),
+            'preview_url': item.get('previewUrl', ''),
+            'itunes_url': item.get('trackViewUrl', ''),
+            'release_date': item.get('releaseDate', ''),
+            'genre': item.get('primaryGenreName', ''),
+            'duration_ms': item.get('trackTimeMillis', 0)
         })
-    
-    # Pattern 4: Artist - Song Title (common in playlists)
-    pattern4 = r'([A-Z][A-Za-z\s&]+)\s+-\s+([A-Z][^,.\n]+)'
-    matches4 = re.findall(pattern4, text)
-    for artist, song in matches4:
-        # Filter out non-music patterns (e.g., dates, locations)
-        if len(artist.split()) <= 4 and len(song.split()) <= 8:
-            mentions.append({
-                'song': song.strip(),
-                'artist': artist.strip(),
-                'pattern': 'dash_format'
-            })
-    
-    # Pattern 5: Listening to Artist
-    pattern5 = r'listening\s+to\s+([A-Z][A-Za-z\s&]+?)(?:\s+today|\s+now|\s+all|,|\.|$)'
-    matches5 = re.findall(pattern5, text, re.IGNORECASE)
-    for artist in matches5:
-        if len(artist.split()) <= 4:
-            mentions.append({
-                'song': '',
-                'artist': artist.strip(),
-                'pattern': 'listening_artist'
-            })
-    
-    return mentions
+    return results
 
 
 def search_itunes(query: str, limit: int = 5) -> List[Dict]:
@@ -95,7 +128,8 @@ def search_itunes(query: str, limit: int = 5) -> List[Dict]:
     Returns:
         List of song results with metadata
     """
-    base_url = "https://itunes.apple.com/search"
+    # Imported here so mention extraction alone doesn't pay for requests
+    import requests
     
     params = {
         'term': query,
@@ -105,31 +139,95 @@ def search_itunes(query: str, limit: int = 5) -> List[Dict]:
     }
     
     try:
-        response = requests.get(base_url, params=params, timeout=10)
+        response = requests.get(ITUNES_SEARCH_URL, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
-        
-        results = []
-        for item in data.get('results', []):
-            results.append({
-                'song_name': item.get('trackName', ''),
-                'artist_name': item.get('artistName', ''),
-                'album_name': item.get('collectionName', ''),
-                'artwork_url': item.get('artworkUrl100', '').replace('100x100', '300x300'),
-                'preview_url': item.get('previewUrl', ''),
-                'itunes_url': item.get('trackViewUrl', ''),
-                'release_date': item.get('releaseDate', ''),
-                'genre': item.get('primaryGenreName', ''),
-                'duration_ms': item.get('trackTimeMillis', 0)
-            })
-        
-        return results
+        return _parse_itunes_results(response.json())
     
     except requests.RequestException as e:
         print(f"iTunes search error: {e}")
         return []
 
 
+async def _search_itunes_async(session, query: str, limit: int = 1) -> List[Dict]:
+    """Async twin of search_itunes() using a shared aiohttp session."""
+    import asyncio
+    import aiohttp
+    
+    params = {
+        'term': query,
+        'media': 'music',
+        'entity': 'song',
+        'limit': str(limit)
+    }
+    
+    try:
+        async with session.get(ITUNES_SEARCH_URL, params=params) as response:
+            response.raise_for_status()
+            # iTunes serves JSON as text/javascript, so skip the content-type check
+            data = await response.json(content_type=None)
+        return _parse_itunes_results(data)
+    
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        # ValueError: a non-JSON body (HTML error or rate-limit page)
+        print(f"iTunes search error: {e}")
+        return []
+
+
+async def _gather_all(queries: List[str]) -> List[List[Dict]]:
+    """Run all iTunes queries concurrently over one connection pool."""
+    import asyncio
+    import aiohttp
+    
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_LOOKUPS)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(
+            *[_search_itunes_async(session, q) for q in queries]
+        )
+
+
+def search_many_on_itunes(queries: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Look up several queries on iTunes, returning the best match for each.
+    
+    Uses concurrent requests when ``aiohttp`` is installed and falls back
+    to one request at a time otherwise.
+    
+    Args:
+        queries: Search queries (duplicates are looked up once)
+        
+    Returns:
+        Dict mapping each query to its top result, or None if not found
+    """
+    unique_queries = list(dict.fromkeys(queries))
+    if not unique_queries:
+        return {}
+    
+    try:
+        import asyncio
+        import aiohttp  # noqa: F401
+        all_results = asyncio.run(_gather_all(unique_queries))
+    except (ImportError, RuntimeError):
+        # aiohttp missing, or we're already inside a running event loop
+        all_results = [search_itunes(q, limit=1) for q in unique_queries]
+    
+    return {
+        q: (results[0] if results else None)
+        for q, results in zip(unique_queries, all_results)
+    }
+
+
+def _build_query(song: str, artist: str = '') -> Optional[str]:
+    """Build the iTunes search term for a song/artist pair."""
+    if artist and song:
+        return f"{song} {artist}"
+    elif song:
+        return song
+    elif artist:
+        return artist
+    return None
+
+
 def search_song_on_itunes(song: str, artist: str = '') -> Optional[Dict]:
     """
     Search for a specific song on iTunes, returning the best match.
@@ -141,14 +239,8 @@ def search_song_on_itunes(song: str, artist: str = '') -> Optional[Dict]:
     Returns:
         Dict with song metadata, or None if not found
     """
-    # Build search query
-    if artist and song:
-        query = f"{song} {artist}"
-    elif song:
-        query = song
-    elif artist:
-        query = artist
-    else:
+    query = _build_query(song, artist)
+    if query is None:
         return None
     
     results = search_itunes(query, limit=1)
@@ -159,7 +251,7 @@ def search_song_on_itunes(song: str, artist: str = '') -> Optional[Dict]:
     return None
 
 
-def extract_and_search_music(journal_entries: List[Dict[str, str]]) -> Dict[str, List[Dict]]:
+def extract_and_search_music(journal_entries: List[Dict[str, str]]) -> Dict[Tuple[str, str], Dict]:
     """
     Extract song mentions from journal entries and search for them on iTunes.
     
@@ -167,40 +259,35 @@ def extract_and_search_music(journal_entries: List[Dict[str, str]]) -> Dict[str,
         journal_entries: List of dicts with 'date' and 'text' keys
         
     Returns:
-        Dict mapping song keys to lists of {metadata, dates mentioned}
+        Dict mapping (song, artist) keys to lists of {metadata, dates mentioned}
     """
-    all_mentions = []
-    
-    # Extract mentions from each entry
+    # Group mentions by normalized song/artist combo
+    song_map = {}
     for entry in journal_entries:
-        mentions = extract_song_mentions(entry['text'])
-        for mention in mentions:
-            mention['date'] = entry['date']
-            all_mentions.append(mention)
+        for song, artist, _ in _extract_mention_tuples(entry['text']):
+            key = (_normalize(song), _normalize(artist))
+            if not any(key):
+                continue
+            
+            if key not in song_map:
+                song_map[key] = {
+                    'song': song,
+                    'artist': artist,
+                    'dates': [],
+                    'count': 0,
+                    'metadata': None
+                }
+            
+            song_map[key]['dates'].append(entry['date'])
+            song_map[key]['count'] += 1
     
-    # Group by song/artist combo
-    song_map = {}
-    for mention in all_mentions:
-        key = f"{mention['song']}|{mention['artist']}".lower()
-        
-        if key not in song_map:
-            song_map[key] = {
-                'song': mention['song'],
-                'artist': mention['artist'],
-                'dates': [],
-                'count': 0,
-                'metadata': None
-            }
-        
-        song_map[key]['dates'].append(mention['date'])
-        song_map[key]['count'] += 1
-    
-    # Search iTunes for each unique song
-    for key, data in song_map.items():
-        if data['song'] or data['artist']:
-            metadata = search_song_on_itunes(data['song'], data['artist'])
-            if metadata:
-                song_map[key]['metadata'] = metadata
+    # Search iTunes for every unique song in one concurrent batch. The
+    # normalized key only de-duplicates; the query uses the text as first
+    # written (normalizing would mangle names like "AC/DC" or "P!nk")
+    queries = {key: _build_query(v['song'], v['artist']) for key, v in song_map.items()}
+    found = search_many_on_itunes(list(queries.values()))
+    for key, query in queries.items():
+        song_map[key]['metadata'] = found.get(query)
     
     # Filter out songs we couldn't find on iTunes
     found_songs = {k: v for k, v in song_map.items() if v['metadata'] is not None}
@@ -10,9 +10,9 @@ Usage:
 """
 
 import argparse
+import functools
 import os
 import sys
-import shutil
 import subprocess
 import socket
 import time
@@ -52,11 +52,45 @@ def show_error(message):
     print(f"ERROR: {message}", file=sys.stderr)
 
 
-def find_python():
-    """Find the Python executable."""
-    # When not frozen, use current interpreter
-    if not getattr(sys, "frozen", False):
-        return sys.executable
+def _python_cache_file():
+    """Return the file used to remember the discovered Python path."""
+    base = os.environ.get("LOCALAPPDATA") if sys.platform == "win32" else None
+    base = base or os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "ReflectingPool", "python_path.txt")
+
+
+def _read_cached_python():
+    """Return the previously discovered Python path if it still exists."""
+    try:
+        with open(_python_cache_file(), "r", encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if path and os.path.exists(path) else None
+
+
+def _write_cached_python(path):
+    """Remember the discovered Python path for the next launch."""
+    cache_file = _python_cache_file()
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            f.write(path)
+    except OSError:
+        pass
+
+
+def _windows_python_sort_key(path):
+    """Order C:\\PythonXYZ folders by version, so 313 ranks above 39."""
+    digits = os.path.basename(os.path.dirname(path))[len("Python"):]
+    return (len(digits), digits)
+
+
+def _scan_for_python():
+    """Search PATH and common install locations for a Python executable."""
+    # Only reached by the frozen launcher on a cache miss, so import lazily
+    import glob
+    import shutil
 
     # Check PATH first (all platforms)
     for candidate in ["python3", "python"]:
@@ -66,10 +100,10 @@ def find_python():
 
     # Platform-specific fallback paths
     if sys.platform == "win32":
-        for ver in ["313", "312", "311", "310", "39"]:
-            path = rf"C:\Python{ver}\python.exe"
-            if os.path.exists(path):
-                return path
+        # One directory listing instead of stat-ing each version separately
+        matches = glob.glob(r"C:\Python3*\python.exe")
+        if matches:
+            return max(matches, key=_windows_python_sort_key)
     else:
         # macOS / Linux common locations
         for path in [
@@ -83,6 +117,24 @@ def find_python():
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def find_python():
+    """Find the Python executable."""
+    # When not frozen, use current interpreter
+    if not getattr(sys, "frozen", False):
+        return sys.executable
+
+    # Reuse the path found on a previous launch if it is still valid
+    path = _read_cached_python()
+    if path:
+        return path
+
+    path = _scan_for_python()
+    if path:
+        _write_cached_python(path)
+    return path
+
+
 def find_free_port(start=8501):
     """Find a free port starting from the given port."""
     for port in range(start, start + 100):
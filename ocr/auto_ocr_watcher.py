@@ -4,6 +4,7 @@ Automatic Journal OCR Watcher
 Monitors a folder for new journal photos and automatically processes them
 """
 
+import re
 import time
 import argparse
 from pathlib import Path
@@ -12,6 +13,10 @@ from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from journal_ocr import JournalOCRPipeline
 
+# YYYY-MM-DD, YYYY_MM_DD or YYYYMMDD in a single compiled pattern
+# (the backreference keeps both separators the same)
+_DATE_RE = re.compile(r'(\d{4})([-_]?)(\d{2})\2(\d{2})')
+
 
 class JournalPhotoHandler(FileSystemEventHandler):
     """Handles new journal photo events"""
@@ -73,20 +78,14 @@ class JournalPhotoHandler(FileSystemEventHandler):
         Try to extract date from filename
         Supports formats like: IMG_2026-01-31.jpg, journal_2026_01_31.jpg, 20260131.jpg
         """
-        import re
-        
-        # Pattern: YYYY-MM-DD or YYYY_MM_DD or YYYYMMDD
-        patterns = [
-            r'(\d{4})-(\d{2})-(\d{2})',  # 2026-01-31
-            r'(\d{4})_(\d{2})_(\d{2})',  # 2026_01_31
-            r'(\d{4})(\d{2})(\d{2})',    # 20260131
-        ]
+        # Phone dumps are mostly names like IMG_ABCD.jpg - skip the regex entirely
+        if not any(c.isdigit() for c in filename):
+            return None
         
-        for pattern in patterns:
-            match = re.search(pattern, filename)
-            if match:
-                year, month, day = match.groups()
-                return f"{year}-{month}-{day}"
+        match = _DATE_RE.search(filename)
+        if match:
+            year, _, month, day = match.groups()
+            return f"{year}-{month}-{day}"
         
         return None
 
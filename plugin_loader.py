@@ -5,12 +5,15 @@ Discovers and loads plugins from the plugins/ directory.
 Plugins register themselves using the @register decorator.
 """
 
+import functools
 import importlib.util
+import os
 import sys
 import traceback
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 import pandas as pd
 
@@ -19,14 +22,22 @@ import pandas as pd
 # Plugin context (stable interface passed to every plugin)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class PluginContext:
     """Everything a plugin needs to render its content.
 
     Fields may be added in future versions but existing fields
-    will not be removed or have their types changed.
+    will not be removed or have their types changed. The context is
+    read-only and shared by every plugin on a page.
     """
 
+    # Declared by hand (dataclass(slots=True) needs Python 3.10); keep in
+    # step with the fields below. No per-instance __dict__.
+    __slots__ = (
+        "df", "rag_db_path", "root", "session_log", "section_header",
+        "extract_common_words", "get_sentiment", "get_rag", "load_theme",
+    )
+
     df: pd.DataFrame
     """Filtered journal DataFrame. Columns: date, text, word_count,
     char_count, sentiment."""
@@ -44,7 +55,7 @@ class PluginContext:
     """section_header(title: str, help_text: str) -> None"""
 
     extract_common_words: Callable
-    """extract_common_words(texts, n_words=30) -> List[Tuple[str, int]]"""
+    """extract_common_words(texts: Iterable[str], n_words=30) -> List[Tuple[str, int]]"""
 
     get_sentiment: Callable
     """get_sentiment(text: str) -> float  (VADER compound score)"""
@@ -55,6 +66,15 @@ class PluginContext:
     load_theme: Callable
     """load_theme() -> dict"""
 
+    # A frozen class with hand-written slots can't be restored by copy or
+    # pickle's default setattr, so set the slots directly
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
 
 # ---------------------------------------------------------------------------
 # Plugin registry
@@ -117,17 +137,60 @@ def discover_plugins(plugins_dir: Path) -> List[PluginInfo]:
 
     Files starting with ``_`` are skipped (use them as helpers).
     Errors are caught per-file so one broken plugin cannot crash the app.
-    """
-    _registry.clear()
 
+    Streamlit calls this on every rerun, so the imported plugins are
+    cached until a file in *plugins_dir* is added, removed or modified.
+    """
     if not plugins_dir.is_dir():
         return []
 
+    plugins, failures = _load_plugins(plugins_dir, _plugin_signature(plugins_dir))
+
+    # Warnings are re-emitted on every call; Streamlit drops any element
+    # a rerun doesn't draw again.
+    if failures:
+        import streamlit as st
+        for file_name, tb in failures:
+            st.sidebar.warning(
+                f"Plugin failed to load: **{file_name}**\n\n"
+                f"```\n{tb}\n```"
+            )
+
+    return list(plugins)
+
+
+def _plugin_signature(plugins_dir: Path) -> Tuple[Tuple[str, int], ...]:
+    """(name, mtime) of every .py file, helpers included, in *plugins_dir*.
+
+    Uses os.scandir, which gets file types from the directory listing
+    itself (and, on Windows, the stat data too).
+    """
+    with os.scandir(plugins_dir) as entries:
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns)
+            for entry in entries
+            if entry.name.endswith(".py") and entry.is_file()
+        ))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_plugins(
+    plugins_dir: Path, signature: Tuple[Tuple[str, int], ...]
+) -> Tuple[Tuple[PluginInfo, ...], Tuple[Tuple[str, str], ...]]:
+    """Import every plugin file in *plugins_dir*.
+
+    *signature* is only used as part of the cache key. Returns the sorted
+    plugins and a ``(file name, traceback tail)`` pair per failed file.
+    """
+    _registry.clear()
+    failures = []
+
     before = 0
-    for py_file in sorted(plugins_dir.glob("*.py")):
-        if py_file.name.startswith("_"):
+    for file_name, _ in signature:
+        if file_name.startswith("_"):
             continue
 
+        py_file = plugins_dir / file_name
         module_name = f"rp_plugin_{py_file.stem}"
         try:
             spec = importlib.util.spec_from_file_location(module_name, str(py_file))
@@ -140,12 +203,9 @@ def discover_plugins(plugins_dir: Path) -> List[PluginInfo]:
                 if not info.source_file:
                     info.source_file = py_file.name
         except Exception:
-            import streamlit as st
-            st.sidebar.warning(
-                f"Plugin failed to load: **{py_file.name}**\n\n"
-                f"```\n{traceback.format_exc()[-500:]}\n```"
-            )
+            failures.append((py_file.name, traceback.format_exc()[-500:]))
 
         before = len(_registry)
 
-    return sorted(_registry, key=lambda p: p.order)
+    # Stable sort: plugins with equal order keep file-name order
+    return tuple(sorted(_registry, key=attrgetter("order"))), tuple(failures)
@@ -21,14 +21,12 @@ def render(ctx):
     df = ctx.df.copy()
     df["date_only"] = df["date"].dt.date
 
-    # Build lookup: date -> list of row dicts
-    entries_by_date = {}
-    for _, row in df.iterrows():
-        d = row["date"].date()
-        entries_by_date.setdefault(d, []).append(row)
+    # Build lookup: date -> positional row indices (rows are only
+    # materialised for the day being previewed)
+    entries_by_date = df.groupby("date_only", sort=False).indices
 
     # Month/year selector
-    all_months = sorted(df["date"].dt.to_period("M").unique())
+    all_months = df["date"].dt.to_period("M").drop_duplicates().sort_values().tolist()
     if not all_months:
         st.info("No entries found.")
         return
@@ -114,9 +112,10 @@ def render(ctx):
     )
 
     if selected_day and selected_day in entries_by_date:
-        for row in entries_by_date[selected_day]:
-            sentiment = row.get("sentiment", None)
+        day_rows = df.iloc[entries_by_date[selected_day]]
+        for row in day_rows.itertuples(index=False):
+            sentiment = getattr(row, "sentiment", None)
             sent_str = f" | Sentiment: {sentiment:.2f}" if sentiment is not None else ""
-            st.caption(f"{row['date'].strftime('%Y-%m-%d')} - "
-                       f"{row['word_count']} words{sent_str}")
-            st.text(row["text"][:600] + ("..." if len(row["text"]) > 600 else ""))
+            st.caption(f"{row.date.strftime('%Y-%m-%d')} - "
+                       f"{row.word_count} words{sent_str}")
+            st.text(row.text[:600] + ("..." if len(row.text) > 600 else ""))
@@ -1,6 +1,23 @@
 """Day-of-Week Sentiment - Analyze mood patterns by weekday."""
 from plugin_loader import register
 
+DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday",
+             "Friday", "Saturday", "Sunday"]
+
+
+def _compute_dow_stats(df):
+    """Per-weekday sentiment and word-count stats from a single groupby.
+
+    Returns a DataFrame indexed by DAY_ORDER; days without entries are NaN.
+    """
+    grouped = df.groupby(df["date"].dt.day_name())
+    return grouped.agg(
+        sentiment_mean=("sentiment", "mean"),
+        entries=("sentiment", "size"),
+        words_mean=("word_count", "mean"),
+        words_sum=("word_count", "sum"),
+    ).reindex(DAY_ORDER)
+
 
 @register(
     "Day-of-Week",
@@ -19,25 +36,17 @@ def render(ctx):
 
     import pandas as pd
 
-    df = ctx.df.copy()
+    df = ctx.df
 
     if "sentiment" not in df.columns:
         st.warning("Sentiment data not available.")
         return
 
-    df["day_name"] = df["date"].dt.day_name()
-    df["day_num"] = df["date"].dt.dayofweek  # Monday=0
-
-    day_order = ["Monday", "Tuesday", "Wednesday", "Thursday",
-                 "Friday", "Saturday", "Sunday"]
-
-    # --- Sentiment by day ---
-    day_sentiment = (
-        df.groupby("day_name")["sentiment"]
-        .agg(["mean", "std", "count"])
-        .reindex(day_order)
-        .fillna(0)
-    )
+    # Cached on the content of the three columns used, so reruns that
+    # don't change the date filter skip the aggregation entirely
+    compute = st.cache_data(show_spinner=False)(_compute_dow_stats)
+    stats = compute(df[["date", "sentiment", "word_count"]])
+    day_stats = stats.fillna(0)
 
     try:
         import plotly.graph_objects as go
@@ -48,12 +57,12 @@ def render(ctx):
         # Bar chart: average sentiment per weekday
         fig = go.Figure()
         colors = [link_color if v >= 0 else "#e74c3c"
-                  for v in day_sentiment["mean"]]
+                  for v in day_stats["sentiment_mean"]]
         fig.add_trace(go.Bar(
-            x=day_order,
-            y=day_sentiment["mean"],
+            x=DAY_ORDER,
+            y=day_stats["sentiment_mean"],
             marker_color=colors,
-            text=[f"{v:.3f}" for v in day_sentiment["mean"]],
+            text=[f"{v:.3f}" for v in day_stats["sentiment_mean"]],
             textposition="outside",
         ))
         fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
@@ -62,27 +71,20 @@ def render(ctx):
             xaxis_title="Day",
             yaxis_title="Avg Sentiment",
             yaxis_range=[
-                min(-0.3, day_sentiment["mean"].min() - 0.1),
-                max(0.3, day_sentiment["mean"].max() + 0.1),
+                min(-0.3, day_stats["sentiment_mean"].min() - 0.1),
+                max(0.3, day_stats["sentiment_mean"].max() + 0.1),
             ],
             height=400,
         )
         st.plotly_chart(fig, use_container_width=True)
 
         # Bar chart: writing volume per weekday
-        day_volume = (
-            df.groupby("day_name")["word_count"]
-            .agg(["mean", "sum", "count"])
-            .reindex(day_order)
-            .fillna(0)
-        )
-
         fig2 = go.Figure()
         fig2.add_trace(go.Bar(
-            x=day_order,
-            y=day_volume["mean"],
+            x=DAY_ORDER,
+            y=day_stats["words_mean"],
             marker_color=link_color,
-            text=[f"{int(v)}" for v in day_volume["mean"]],
+            text=[f"{int(v)}" for v in day_stats["words_mean"]],
             textposition="outside",
             name="Avg words",
         ))
@@ -101,26 +103,26 @@ def render(ctx):
     st.divider()
     st.subheader("Weekly Patterns")
 
-    best_day_idx = day_sentiment["mean"].idxmax()
-    worst_day_idx = day_sentiment["mean"].idxmin()
-    busiest_day = df.groupby("day_name").size().reindex(day_order).idxmax()
+    best_day_idx = day_stats["sentiment_mean"].idxmax()
+    worst_day_idx = day_stats["sentiment_mean"].idxmin()
+    busiest_day = day_stats["entries"].idxmax()
 
     m1, m2, m3 = st.columns(3)
     m1.metric("Happiest Day", best_day_idx,
-              delta=f"{day_sentiment.loc[best_day_idx, 'mean']:.3f}")
+              delta=f"{day_stats.loc[best_day_idx, 'sentiment_mean']:.3f}")
     m2.metric("Toughest Day", worst_day_idx,
-              delta=f"{day_sentiment.loc[worst_day_idx, 'mean']:.3f}")
+              delta=f"{day_stats.loc[worst_day_idx, 'sentiment_mean']:.3f}")
     m3.metric("Most Entries On", busiest_day,
-              delta=f"{int(df.groupby('day_name').size().reindex(day_order).loc[busiest_day])} entries")
+              delta=f"{int(day_stats.loc[busiest_day, 'entries'])} entries")
 
     # --- Breakdown table ---
     st.divider()
     st.subheader("Detailed Breakdown")
 
+    # Formatted straight from the cached aggregation (NaN = no entries)
     table_data = []
-    for day in day_order:
-        day_df = df[df["day_name"] == day]
-        if day_df.empty:
+    for day, row in zip(DAY_ORDER, stats.itertuples(index=False)):
+        if pd.isna(row.entries):
             table_data.append({
                 "Day": day, "Entries": 0, "Avg Sentiment": "-",
                 "Avg Words": "-", "Total Words": 0,
@@ -128,10 +130,10 @@ def render(ctx):
         else:
             table_data.append({
                 "Day": day,
-                "Entries": len(day_df),
-                "Avg Sentiment": f"{day_df['sentiment'].mean():.3f}",
-                "Avg Words": f"{int(day_df['word_count'].mean()):,}",
-                "Total Words": f"{int(day_df['word_count'].sum()):,}",
+                "Entries": int(row.entries),
+                "Avg Sentiment": f"{row.sentiment_mean:.3f}",
+                "Avg Words": f"{int(row.words_mean):,}",
+                "Total Words": f"{int(row.words_sum):,}",
             })
 
     st.dataframe(
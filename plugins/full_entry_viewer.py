@@ -2,6 +2,22 @@
 from plugin_loader import register
 
 
+def _format_paragraphs(text):
+    """Entry text as escaped HTML, one <p> per line and <br/> for blank lines."""
+    from html import escape
+
+    return "".join(
+        "<p style='margin-bottom: 0.8em;'>%s</p>" % escape(p) if p.strip() else "<br/>"
+        for p in text.split("\n")
+    )
+
+
+def _sort_by_date(dates):
+    """Positional order that sorts *dates*, plus the sorted calendar dates."""
+    order = dates.to_numpy().argsort(kind="stable")
+    return order, dates.iloc[order].dt.date.tolist()
+
+
 @register(
     "Read Entries",
     order=140,
@@ -17,8 +33,11 @@ def render(ctx):
         st.info("No entries to display.")
         return
 
-    df = ctx.df.sort_values("date").reset_index(drop=True)
-    n_entries = len(df)
+    # Only the date column is hashed and sorted; cached per filter state so
+    # prev/next clicks don't re-sort the whole frame
+    sort_by_date = st.cache_data(show_spinner=False)(_sort_by_date)
+    order, all_dates = sort_by_date(ctx.df["date"])
+    n_entries = len(order)
 
     # Session state for current entry index
     if "fev_index" not in st.session_state:
@@ -29,7 +48,6 @@ def render(ctx):
     idx = max(idx, 0)
 
     # Date selector
-    all_dates = df["date"].dt.date.tolist()
     current_date = all_dates[idx]
 
     selected_date = st.selectbox(
@@ -42,11 +60,8 @@ def render(ctx):
 
     # Find the index for the selected date
     if selected_date != current_date:
-        for i, d in enumerate(all_dates):
-            if d == selected_date:
-                idx = i
-                st.session_state.fev_index = idx
-                break
+        idx = all_dates.index(selected_date)
+        st.session_state.fev_index = idx
 
     # Navigation buttons
     col_prev, col_counter, col_next = st.columns([1, 2, 1])
@@ -71,7 +86,7 @@ def render(ctx):
             st.rerun()
 
     # Display the entry
-    row = df.iloc[idx]
+    row = ctx.df.iloc[order[idx]]
     entry_date = row["date"]
     text = row["text"]
     word_count = row["word_count"]
@@ -99,12 +114,10 @@ def render(ctx):
     bg_color = theme.get("bg_color", "#ffffff")
     border_radius = theme.get("border_radius", 2)
 
-    # Split into paragraphs for readability
-    paragraphs = text.split("\n")
-    formatted = "".join(
-        f"<p style='margin-bottom: 0.8em;'>{p}</p>" if p.strip() else "<br/>"
-        for p in paragraphs
-    )
+    # Split into paragraphs for readability (cached per entry text, so
+    # flipping back and forth doesn't rebuild long entries)
+    format_paragraphs = st.cache_data(show_spinner=False)(_format_paragraphs)
+    formatted = format_paragraphs(text)
 
     st.markdown(
         f"""<div style="
@@ -8,47 +8,34 @@ things work.
 
 from plugin_loader import register
 
+try:
+    import markdown as _markdown
+except ImportError:
+    _markdown = None
+
 GITHUB_REPO = "https://github.com/aadams149/Reflecting-Pool"
 GITHUB_PROFILE = "https://github.com/aadams149"
 
+ANALYTICS_SECTION = "Understanding the Analytics"
 
-@register(
-    "Help & FAQ",
-    order=200,
-    needs_df=False,
-    description="Plain-language usage guide and frequently asked questions",
-)
-def render(ctx):
-    import streamlit as st
 
-    st.markdown(
-        "Welcome to **Reflecting Pool**! This guide covers how to use "
-        "the app and answers frequently asked questions. Pick a section "
-        "below to get started."
-    )
+def _prerender(md: str) -> str:
+    """Convert a static markdown block to HTML once, at import time.
 
-    # GitHub links
-    st.markdown(
-        f'<a href="{GITHUB_REPO}" target="_blank" title="View on GitHub">'
-        '<img src="https://github.githubassets.com/favicons/favicon-dark.svg" '
-        'width="20" style="vertical-align: middle; margin-right: 6px;" />'
-        "Reflecting Pool on GitHub</a>"
-        "&nbsp;&nbsp;|&nbsp;&nbsp;"
-        f'<a href="{GITHUB_PROFILE}" target="_blank">@aadams149</a>',
-        unsafe_allow_html=True,
-    )
-    st.divider()
+    Falls back to the markdown source (which Streamlit renders as usual)
+    when the ``markdown`` package isn't installed.
+    """
+    if _markdown is None:
+        return md
+    return _markdown.markdown(md, extensions=["tables"])
 
-    # ==================================================================
-    # USAGE GUIDE
-    # ==================================================================
-    st.subheader("Usage Guide")
 
-    # ------------------------------------------------------------------
-    # 1. Getting Started
-    # ------------------------------------------------------------------
-    with st.expander("Getting Started", expanded=False):
-        st.markdown("""
+# title -> body for each section; bodies are converted once at import
+# rather than re-parsed on every rerun, and only the selected one is sent
+# to the browser
+
+USAGE_GUIDE = {
+    "Getting Started": _prerender("""
 **What is Reflecting Pool?**
 
 Reflecting Pool turns your handwritten journal into a searchable,
@@ -67,13 +54,8 @@ entries right here in the dashboard.
 4. Open this dashboard and make sure the *OCR Output Directory* in the
    sidebar points to the folder that contains the processed text.
 5. Start exploring!
-""")
-
-    # ------------------------------------------------------------------
-    # 2. Adding Journal Entries
-    # ------------------------------------------------------------------
-    with st.expander("Adding Journal Entries", expanded=False):
-        st.markdown("""
+"""),
+    "Adding Journal Entries": _prerender("""
 **Taking good photos**
 
 - Use natural, even lighting - avoid harsh shadows across the page.
@@ -92,13 +74,8 @@ There are two ways to turn photos into text:
 
 After processing, each entry gets a date (extracted from the filename
 or the photo's creation date) and a plain-text file.
-""")
-
-    # ------------------------------------------------------------------
-    # 3. Searching Your Journal
-    # ------------------------------------------------------------------
-    with st.expander("Searching Your Journal", expanded=False):
-        st.markdown("""
+"""),
+    "Searching Your Journal": _prerender("""
 **How search works**
 
 Reflecting Pool uses *semantic search*, which means you can search by
@@ -120,21 +97,8 @@ work pressure even if those exact words don't appear.
 - Try different angles: "hiking" vs. "time spent outdoors".
 - The search looks at *all* entries, not just the ones visible in the
   current date filter.
-""")
-
-    # ------------------------------------------------------------------
-    # 4. Understanding Analytics
-    # ------------------------------------------------------------------
-    with st.expander("Understanding the Analytics", expanded=False):
-        if ctx.df.empty:
-            st.info(
-                "Once you add journal entries, the **Analytics** tab will "
-                "show charts and statistics about your writing."
-            )
-        else:
-            st.markdown(f"You currently have **{len(ctx.df)}** entries loaded.")
-
-        st.markdown("""
+"""),
+    "Understanding the Analytics": _prerender("""
 **Sentiment analysis**
 
 Each entry is given a *sentiment score* between -1 (very negative) and
@@ -154,13 +118,8 @@ to the emotional tone - not a clinical assessment.
 | Word count over time | How much you wrote in each entry |
 | Common words | The words that appear most frequently |
 | Entry length distribution | A histogram of entry lengths |
-""")
-
-    # ------------------------------------------------------------------
-    # 5. Music Connections
-    # ------------------------------------------------------------------
-    with st.expander("Music Connections", expanded=False):
-        st.markdown("""
+"""),
+    "Music Connections": _prerender("""
 **What the Music tab does**
 
 Reflecting Pool scans your journal entries for mentions of songs and
@@ -178,13 +137,8 @@ The detection works best when you're specific in your journal:
 
 If the Music tab says no mentions were detected, try writing about
 songs or artists in your entries and they'll appear next time.
-""")
-
-    # ------------------------------------------------------------------
-    # 6. Customizing Appearance
-    # ------------------------------------------------------------------
-    with st.expander("Customizing Appearance", expanded=False):
-        st.markdown("""
+"""),
+    "Customizing Appearance": _prerender("""
 **Themes and colors**
 
 Open the **Appearance** tab to change the look of the dashboard. You
@@ -202,13 +156,8 @@ the dashboard.
 
 Use the *Reset to Defaults* button on the Appearance tab to go back to
 the original look.
-""")
-
-    # ------------------------------------------------------------------
-    # 7. Troubleshooting
-    # ------------------------------------------------------------------
-    with st.expander("Troubleshooting", expanded=False):
-        st.markdown("""
+"""),
+    "Troubleshooting": _prerender("""
 **"No journal entries found"**
 
 - Make sure the *OCR Output Directory* in the sidebar points to the
@@ -237,16 +186,11 @@ the original look.
   the date range in the sidebar.
 - The first search after starting the app may be slower while the
   database loads into memory.
-""")
+"""),
+}
 
-    # ==================================================================
-    # FAQ
-    # ==================================================================
-    st.divider()
-    st.subheader("Frequently Asked Questions")
-
-    with st.expander("Does Reflecting Pool share my data with anyone?", expanded=False):
-        st.markdown("""
+FAQ = {
+    "Does Reflecting Pool share my data with anyone?": _prerender("""
 **No.** Reflecting Pool runs entirely on your own computer. Your
 journal text, photos, and search database all stay on your machine.
 Nothing is uploaded to the cloud or shared with third parties.
@@ -261,10 +205,8 @@ The only network calls the app makes are:
 
 You can use the app completely offline if you skip the Music and Chat
 features.
-""")
-
-    with st.expander("I think I've found a bug. How can I report it?", expanded=False):
-        st.markdown(f"""
+"""),
+    "I think I've found a bug. How can I report it?": _prerender(f"""
 The best way to report a bug is to open an issue on GitHub:
 
 1. Go to the [Reflecting Pool Issues page]({GITHUB_REPO}/issues).
@@ -274,27 +216,21 @@ The best way to report a bug is to open an issue on GitHub:
 
 If you're not comfortable with GitHub, you can also reach the
 developer at their [GitHub profile]({GITHUB_PROFILE}).
-""")
-
-    with st.expander("What languages does Reflecting Pool support?", expanded=False):
-        st.markdown("""
+"""),
+    "What languages does Reflecting Pool support?": _prerender("""
 Currently, Reflecting Pool is optimized for **English** handwriting.
 The OCR engine (Tesseract) supports many languages, but the sentiment
 analysis and text processing features are English-focused.
 
 Support for additional languages is something we'd like to add in the
 future.
-""")
-
-    with st.expander("Can I use typed/printed text instead of handwriting?", expanded=False):
-        st.markdown("""
+"""),
+    "Can I use typed/printed text instead of handwriting?": _prerender("""
 Yes! The OCR engine works with both handwritten and printed text.
 In fact, printed text tends to be recognized more accurately. Just
 take a photo of the page the same way you would for handwriting.
-""")
-
-    with st.expander("How accurate is the sentiment analysis?", expanded=False):
-        st.markdown("""
+"""),
+    "How accurate is the sentiment analysis?": _prerender("""
 Sentiment analysis provides a general sense of the emotional tone of
 each entry, but it's not perfect. The tool (VADER) was designed for
 social media text, so it works best with straightforward language.
@@ -306,10 +242,8 @@ Things to keep in mind:
   to neutral.
 - The scores are most useful as a **general trend** over time rather
   than a precise measurement of any single entry.
-""")
-
-    with st.expander("Can I back up my data?", expanded=False):
-        st.markdown("""
+"""),
+    "Can I back up my data?": _prerender("""
 Yes. Your data lives in a few places on your computer:
 
 | What | Where |
@@ -322,10 +256,8 @@ Yes. Your data lives in a few places on your computer:
 To back up, simply copy these folders to an external drive or cloud
 storage. The search database can also be rebuilt at any time by
 clicking *Ingest to RAG* in the sidebar.
-""")
-
-    with st.expander("Can I add plugins or extend the app?", expanded=False):
-        st.markdown(f"""
+"""),
+    "Can I add plugins or extend the app?": _prerender(f"""
 Yes! Reflecting Pool has a plugin system. You can add new tabs by
 dropping a Python file into the `plugins/` folder. Each plugin is a
 small script that uses the `@register` decorator to add itself to the
@@ -333,10 +265,8 @@ dashboard.
 
 For details on how to write a plugin, see the
 [plugins README]({GITHUB_REPO}/tree/main/plugins) on GitHub.
-""")
-
-    with st.expander("Do I need an internet connection?", expanded=False):
-        st.markdown("""
+"""),
+    "Do I need an internet connection?": _prerender("""
 For most features, **no**. The OCR processing, analytics, search, and
 appearance customization all work offline.
 
@@ -344,4 +274,58 @@ You will need an internet connection for:
 
 - **Music tab** - looks up song info on Apple Music / iTunes.
 - **Chat tab** - sends queries to an AI provider (if configured).
-""")
+"""),
+}
+
+
+@register(
+    "Help & FAQ",
+    order=200,
+    needs_df=False,
+    description="Plain-language usage guide and frequently asked questions",
+)
+def render(ctx):
+    import streamlit as st
+
+    st.markdown(
+        "Welcome to **Reflecting Pool**! This guide covers how to use "
+        "the app and answers frequently asked questions. Pick a section "
+        "below to get started."
+    )
+
+    # GitHub links
+    st.markdown(
+        f'<a href="{GITHUB_REPO}" target="_blank" title="View on GitHub">'
+        '<img src="https://github.githubassets.com/favicons/favicon-dark.svg" '
+        'width="20" style="vertical-align: middle; margin-right: 6px;" />'
+        "Reflecting Pool on GitHub</a>"
+        "&nbsp;&nbsp;|&nbsp;&nbsp;"
+        f'<a href="{GITHUB_PROFILE}" target="_blank">@aadams149</a>',
+        unsafe_allow_html=True,
+    )
+    st.divider()
+
+    # ==================================================================
+    # USAGE GUIDE
+    # ==================================================================
+    st.subheader("Usage Guide")
+
+    title = st.selectbox("Jump to section", list(USAGE_GUIDE), key="help_section")
+    if title == ANALYTICS_SECTION:
+        if ctx.df.empty:
+            st.info(
+                "Once you add journal entries, the **Analytics** tab will "
+                "show charts and statistics about your writing."
+            )
+        else:
+            st.markdown(f"You currently have **{len(ctx.df)}** entries loaded.")
+    st.markdown(USAGE_GUIDE[title], unsafe_allow_html=True)
+
+    # ==================================================================
+    # FAQ
+    # ==================================================================
+    st.divider()
+    st.subheader("Frequently Asked Questions")
+
+    question = st.selectbox("Question", list(FAQ), key="help_faq")
+    st.markdown(FAQ[question], unsafe_allow_html=True)
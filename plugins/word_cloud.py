@@ -1,7 +1,65 @@
 """Word Cloud - Visual word frequency display."""
+import os
+import threading
+
 from plugin_loader import register
 
 
+def _prewarm_wordcloud():
+    """Import wordcloud (and the matplotlib colormaps it loads) ahead of time."""
+    try:
+        import wordcloud  # noqa: F401
+    except ImportError:
+        pass  # render() shows the install hint and text fallback
+
+
+# The first cold import costs several hundred ms; pay it in the background
+# at plugin load rather than when the user first clicks Generate.
+# Set RP_PREWARM=0 to disable.
+if os.environ.get("RP_PREWARM", "1") == "1":
+    threading.Thread(target=_prewarm_wordcloud, daemon=True).start()
+
+
+def _render_wordcloud_png(freq_items, bg, n_words):
+    """Rasterise the word cloud to PNG bytes.
+
+    Wrapped in st.cache_data by render(), so reruns with the same words,
+    background and size reuse the image instead of redrawing it.
+    """
+    import io
+    from wordcloud import WordCloud
+
+    wc = WordCloud(
+        width=1200, height=600,
+        background_color=bg,
+        colormap="viridis",
+        max_words=n_words,
+        prefer_horizontal=0.7,
+    ).generate_from_frequencies(dict(freq_items))
+
+    # WordCloud already renders a PIL image; no need to go through matplotlib
+    buf = io.BytesIO()
+    wc.to_image().save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _fallback_html(freq_items):
+    """Words sized and faded by frequency, for when wordcloud isn't installed.
+
+    Wrapped in st.cache_data by render(), like _render_wordcloud_png.
+    """
+    max_count = freq_items[0][1] if freq_items else 1
+    html_parts = []
+    for word, count in freq_items:
+        size = 14 + int(36 * (count / max_count))
+        opacity = 0.4 + 0.6 * (count / max_count)
+        html_parts.append(
+            f'<span style="font-size:{size}px; opacity:{opacity}; '
+            f'margin:4px; display:inline-block;">{word}</span>'
+        )
+    return f'<div style="line-height:2.5;">{"  ".join(html_parts)}</div>'
+
+
 @register(
     "Word Cloud",
     order=110,
@@ -18,33 +76,28 @@ def render(ctx):
         return
 
     n_words = st.slider("Number of words", 20, 200, 80, key="wc_n_words")
-    word_freq = ctx.extract_common_words(ctx.df["text"].tolist(), n_words=n_words)
+    word_freq = ctx.extract_common_words(ctx.df["text"], n_words=n_words)
 
     if not word_freq:
         st.info("Not enough text to generate a word cloud.")
         return
 
-    try:
-        from wordcloud import WordCloud
-        import matplotlib.pyplot as plt
+    # Every tab renders on every rerun; don't import wordcloud and lay out
+    # an image until the user actually asks for one this session
+    if not st.session_state.get("wc_generated"):
+        st.button(
+            "Generate word cloud",
+            key="wc_generate",
+            on_click=lambda: st.session_state.update(wc_generated=True),
+        )
+        return
 
-        freq_dict = dict(word_freq)
+    try:
         theme = ctx.load_theme()
         bg = theme.get("bg_color", "#ffffff")
 
-        wc = WordCloud(
-            width=1200, height=600,
-            background_color=bg,
-            colormap="viridis",
-            max_words=n_words,
-            prefer_horizontal=0.7,
-        ).generate_from_frequencies(freq_dict)
-
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.imshow(wc, interpolation="bilinear")
-        ax.axis("off")
-        st.pyplot(fig)
-        plt.close(fig)
+        render_png = st.cache_data(show_spinner=False)(_render_wordcloud_png)
+        st.image(render_png(tuple(word_freq), bg, n_words), use_container_width=True)
 
     except ImportError:
         st.info(
@@ -53,16 +106,5 @@ def render(ctx):
             "Showing text-based fallback below."
         )
         # Fallback: HTML-based sized word display
-        max_count = word_freq[0][1] if word_freq else 1
-        html_parts = []
-        for word, count in word_freq:
-            size = 14 + int(36 * (count / max_count))
-            opacity = 0.4 + 0.6 * (count / max_count)
-            html_parts.append(
-                f'<span style="font-size:{size}px; opacity:{opacity}; '
-                f'margin:4px; display:inline-block;">{word}</span>'
-            )
-        st.markdown(
-            f'<div style="line-height:2.5;">{"  ".join(html_parts)}</div>',
-            unsafe_allow_html=True,
-        )
+        fallback_html = st.cache_data(show_spinner=False)(_fallback_html)
+        st.markdown(fallback_html(tuple(word_freq)), unsafe_allow_html=True)
@@ -4,50 +4,220 @@ Journal RAG System
 Semantic search and Q&A over journal entries using local embeddings and LLM
 """
 
+import copy
 import json
+import os
+import platform
+import re
 import shutil
 import argparse
+import functools
+import gc
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 from datetime import datetime
 import chromadb
+import numpy as np
+import torch
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 
+# Optional: faster JSON parsing (OCR metadata files, Ollama's stream)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Chunks per SentenceTransformer forward pass / per ChromaDB add() call
+EMBED_BATCH_SIZE = 64
+ADD_BATCH_SIZE = 1000
+
+# Threads reading and chunking OCR files during ingest
+INGEST_READ_WORKERS = 8
+
+
+# Embedding backends: "torch" (default, FP32) or "onnx-int8" (dynamically
+# quantized ONNX Runtime model, typically 2-4x faster on CPU). The default
+# can be changed with the RP_EMBED_BACKEND environment variable.
+EMBED_BACKENDS = ("torch", "onnx-int8")
+
+# Restores performed in this process, per database path. A JournalRAG
+# reconnects when this has moved on since it opened its client (see
+# JournalRAG.collection), since restore() shuts down the shared client.
+_restore_generation: Dict[str, int] = {}
+
+# HNSW index parameters, applied when the collection is first created (an
+# existing database keeps the index it was built with). Larger M and
+# construction_ef give better recall for a bigger, slower-to-build index;
+# search_ef trades query latency for recall. For a personal journal (well
+# under 100k chunks) these keep recall close to exact search while queries
+# stay in the low milliseconds.
+HNSW_DEFAULTS = {"M": 32, "construction_ef": 200, "search_ef": 64}
+
+# An entry ID that is just a date, e.g. "2026-01-31"
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Sidecar in each backup directory caching its total size for list_backups()
+_SIZE_FILE = ".size"
+
+# Sentence-ending punctuation followed by whitespace, for _chunk_text
+_SENTENCE_BREAKS = tuple(p + w for p in ".!?" for w in " \n\t\r")
+
+
+def _onnx_int8_file() -> str:
+    """Pre-quantized ONNX export shipped with the sentence-transformers models."""
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+    return "onnx/model_quint8_avx2.onnx"  # runs on any x86-64 with AVX2
+
+
+def _configure_torch_threads():
+    """Give CPU inference more than one thread unless the user chose a count.
+    
+    Some environments (containers, CI, servers) start torch with a single
+    intra-op thread, which makes CPU embedding several times slower. An
+    explicit OMP_NUM_THREADS always wins; set it to 1 when running several
+    ingest processes side by side so they don't oversubscribe the cores.
+    """
+    if "OMP_NUM_THREADS" in os.environ:
+        return
+    wanted = max(1, (os.cpu_count() or 1) // 2)
+    if torch.get_num_threads() < wanted:
+        torch.set_num_threads(wanted)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_embedder(model_name: str, backend: str = "torch") -> SentenceTransformer:
+    """Load a sentence-transformers model once per process.
+    
+    Every JournalRAG (the app's cached instance, CLI commands, tests)
+    shares the same weights instead of reloading them from disk.
+    """
+    print(f"Loading embedding model: {model_name} ({backend})")
+    if backend == "onnx-int8":
+        # Needs sentence-transformers>=3.2 with the ONNX extra:
+        #   pip install "sentence-transformers[onnx]"
+        return SentenceTransformer(
+            model_name,
+            backend="onnx",
+            model_kwargs={"file_name": _onnx_int8_file()},
+        )
+    _configure_torch_threads()
+    return SentenceTransformer(model_name)
+
+
+def _encode(embedder: SentenceTransformer, texts: List[str]):
+    """(len(texts), dim) numpy array of normalized embeddings"""
+    # inference_mode skips autograd bookkeeping entirely (cheaper than
+    # the no_grad encode() uses internally)
+    with torch.inference_mode():
+        return embedder.encode(
+            texts,
+            batch_size=EMBED_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+
+
+@functools.lru_cache(maxsize=128)
+def _embed_query(embedder: SentenceTransformer, query: str) -> Tuple[float, ...]:
+    """Embedding of a single search query, cached per (model, query).
+    
+    Users repeat searches, and an 'ask' often follows a 'search' for the
+    same text; those skip the model entirely. Embedders are shared
+    singletons (see _load_embedder), so keying on them is safe.
+    """
+    return tuple(_encode(embedder, [query])[0].tolist())
+
 
 class JournalRAG:
     """RAG system for semantic search over journal entries"""
     
     def __init__(self, db_path: str = "./vector_db", 
-                 embedding_model: str = "all-MiniLM-L6-v2"):
+                 embedding_model: str = "all-MiniLM-L6-v2",
+                 embedding_backend: Optional[str] = None,
+                 hnsw: Optional[Dict[str, int]] = None):
         """
         Initialize RAG system
         
         Args:
             db_path: Path to ChromaDB storage
             embedding_model: sentence-transformers model to use
+            embedding_backend: "torch" or "onnx-int8" (default: the
+                RP_EMBED_BACKEND environment variable, else "torch")
+            hnsw: Overrides for HNSW_DEFAULTS, used if the collection
+                has to be created
         """
+        backend = embedding_backend or os.environ.get("RP_EMBED_BACKEND", "torch")
+        if backend not in EMBED_BACKENDS:
+            raise ValueError(
+                f"Unknown embedding backend: {backend} "
+                f"(choose from {', '.join(EMBED_BACKENDS)})"
+            )
+        
         self.db_path = Path(db_path)
         self.db_path.mkdir(exist_ok=True, parents=True)
         
-        print(f"Loading embedding model: {embedding_model}")
-        self.embedder = SentenceTransformer(embedding_model)
+        self.embedder = _load_embedder(embedding_model, backend)
         
         # Initialize ChromaDB with persistent storage
-        self.client = chromadb.PersistentClient(
-            path=str(self.db_path),
-            settings=Settings(anonymized_telemetry=False)
-        )
+        self._db_key = str(self.db_path.resolve())
+        self._hnsw = {**HNSW_DEFAULTS, **(hnsw or {})}
+        self._connect()
         
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name="journal_entries",
-            metadata={"description": "Personal journal entries"}
-        )
+        # Bumped on every add/delete; keys the _memoized() results
+        self._version = 0
+        self._memo = {}
+        
+        # Chunk count as of our last add/delete, kept up to date here so
+        # the hot paths don't query Chroma for it. Another process may
+        # still change the database, so anything where a stale value would
+        # give a wrong answer asks Chroma instead.
+        self._count = self.collection.count()
         
         print("RAG system initialized")
         print(f"  Database: {self.db_path}")
-        print(f"  Entries in database: {self.collection.count()}")
+        print(f"  Entries in database: {self._count}")
+    
+    def _connect(self):
+        """Open the Chroma client and journal collection for db_path"""
+        self.client = chromadb.PersistentClient(
+            path=str(self.db_path),
+            settings=Settings(anonymized_telemetry=False)
+        )
+        self._collection = self._open_collection()
+        self._generation = _restore_generation.get(self._db_key, 0)
+    
+    @property
+    def collection(self):
+        """The journal collection, reopened first if a JournalRAG in this
+        process has restored the database since this one connected"""
+        if self._generation != _restore_generation.get(self._db_key, 0):
+            self._connect()
+            self._version += 1
+            self._count = self._collection.count()
+        return self._collection
+    
+    def _open_collection(self):
+        """Get the journal collection, creating it with our HNSW settings"""
+        metadata = {"description": "Personal journal entries"}
+        try:
+            return self.client.get_or_create_collection(
+                name="journal_entries",
+                metadata={**metadata,
+                          **{f"hnsw:{k}": v for k, v in self._hnsw.items()}}
+            )
+        except ValueError:
+            # Some Chroma versions refuse to change the index parameters
+            # of an existing collection; open it as it is
+            return self.client.get_or_create_collection(
+                name="journal_entries",
+                metadata=metadata
+            )
     
     def ingest_from_ocr(self, ocr_output_dir: str, chunk_size: int = 500,
                        overlap: int = 50) -> int:
@@ -78,61 +248,127 @@ class JournalRAG:
             print("No text files found to ingest")
             return 0
         
+        # New chunks are collected across all files, then embedded and
+        # written in large batches once the loop is done
+        new_ids, new_docs, new_metas = [], [], []
+        queued = set()
+        
         ingested = 0
-        for text_file in text_files:
-            metadata_file = metadata_dir / f"{text_file.stem}.json"
-            
-            if not metadata_file.exists():
-                print(f"  Skipping {text_file.name} - no metadata found")
-                continue
-            
-            # Load text and metadata
-            with open(text_file, 'r', encoding='utf-8') as f:
-                text = f.read().strip()
-            
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-            
-            if not text:
-                print(f"  Skipping {text_file.name} - empty text")
-                continue
-            
-            # Chunk text if it's long
-            chunks = self._chunk_text(text, chunk_size, overlap)
-            
-            # Add each chunk to database
-            for i, chunk in enumerate(chunks):
-                doc_id = f"{metadata['entry_date']}_chunk_{i}"
+        # Files are read and chunked on a small thread pool so disk reads
+        # overlap; map() yields in file order, so the first file to claim
+        # an ID still wins
+        with ThreadPoolExecutor(max_workers=INGEST_READ_WORKERS) as pool:
+            loaded = pool.map(
+                lambda text_file: self._load_and_chunk(
+                    text_file, metadata_dir, chunk_size, overlap
+                ),
+                text_files
+            )
+            for text_file, (metadata, chunks) in zip(text_files, loaded):
+                if metadata is None:
+                    print(f"  Skipping {text_file.name} - {chunks}")
+                    continue
                 
-                # Check if already exists
-                existing = self.collection.get(ids=[doc_id])
-                if existing['ids']:
-                    continue  # Skip duplicates
+                # Queue each chunk for the database
+                for i, chunk in enumerate(chunks):
+                    doc_id = f"{metadata['entry_date']}_chunk_{i}"
                 
-                # Create metadata for this chunk
-                chunk_metadata = {
-                    "date": metadata['entry_date'],
-                    "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    "word_count": metadata['word_count'],
-                    "source_file": str(text_file.absolute())
-                }
+                    # First file to claim an ID this run wins
+                    if doc_id in queued:
+                        continue
                 
-                # Add to collection
+                    # Create metadata for this chunk
+                    chunk_metadata = {
+                        "date": metadata['entry_date'],
+                        "chunk_index": i,
+                        "total_chunks": len(chunks),
+                        "word_count": metadata['word_count'],
+                        "source_file": str(text_file.absolute()),
+                        "content_hash": _content_hash(chunk)
+                    }
+                
+                    queued.add(doc_id)
+                    new_ids.append(doc_id)
+                    new_docs.append(chunk)
+                    new_metas.append(chunk_metadata)
+                
+                ingested += 1
+                print(f"  {text_file.name} ({len(chunks)} chunks)")
+        
+        # Skip chunks already in the database, looked up in bulk. include=[]
+        # returns only the IDs, not documents/metadata/embeddings.
+        existing = set()
+        for start in range(0, len(new_ids), ADD_BATCH_SIZE):
+            existing.update(self.collection.get(
+                ids=new_ids[start:start + ADD_BATCH_SIZE], include=[]
+            )['ids'])
+        if existing:
+            keep = [i for i, doc_id in enumerate(new_ids) if doc_id not in existing]
+            new_ids = [new_ids[i] for i in keep]
+            new_docs = [new_docs[i] for i in keep]
+            new_metas = [new_metas[i] for i in keep]
+        
+        if new_docs:
+            # Identical chunk text (e.g. the same page OCR'd twice under
+            # different dates) goes through the model only once
+            first_seen = {}
+            for i, meta in enumerate(new_metas):
+                first_seen.setdefault(meta['content_hash'], i)
+            print(f"\nEmbedding {len(first_seen)} new chunks...")
+            vectors = self._embed([new_docs[i] for i in first_seen.values()])
+            row = {h: r for r, h in enumerate(first_seen)}
+            embeddings = vectors[[row[m['content_hash']] for m in new_metas]]
+            for start in range(0, len(new_ids), ADD_BATCH_SIZE):
+                end = start + ADD_BATCH_SIZE
                 self.collection.add(
-                    ids=[doc_id],
-                    documents=[chunk],
-                    metadatas=[chunk_metadata]
+                    ids=new_ids[start:end],
+                    embeddings=embeddings[start:end].tolist(),
+                    documents=new_docs[start:end],
+                    metadatas=new_metas[start:end]
                 )
-            
-            ingested += 1
-            print(f"  {text_file.name} ({len(chunks)} chunks)")
+            self._version += 1
+            self._count += len(new_ids)
         
         print(f"\nIngested {ingested} entries")
-        print(f"  Total documents in database: {self.collection.count()}")
+        print(f"  Total documents in database: {self._count}")
         
         return ingested
     
+    def _load_and_chunk(self, text_file: Path, metadata_dir: Path,
+                        chunk_size: int, overlap: int):
+        """
+        Read one OCR'd entry and split it into chunks (runs on the
+        ingest reader threads)
+        
+        Returns:
+            (metadata, chunks), or (None, reason) if the file is skipped
+        """
+        metadata_file = metadata_dir / f"{text_file.stem}.json"
+        if not metadata_file.exists():
+            return None, "no metadata found"
+        
+        # Load text and metadata
+        text = text_file.read_text(encoding='utf-8').strip()
+        metadata = _read_json(metadata_file)
+        
+        if not text:
+            return None, "empty text"
+        
+        # Chunk text if it's long
+        return metadata, self._chunk_text(text, chunk_size, overlap)
+    
+    def _embed(self, texts: List[str]):
+        """
+        Embed texts with the local sentence-transformers model
+        
+        Both ingestion and search go through here, so stored and query
+        vectors always come from the same model.
+        
+        Returns:
+            (len(texts), dim) numpy array of normalized embeddings
+        """
+        return _encode(self.embedder, texts)
+    
     def _chunk_text(self, text: str, chunk_size: int, overlap: int) -> List[str]:
         """
         Split text into overlapping chunks
@@ -156,11 +392,12 @@ class JournalRAG:
             
             # Try to break at sentence boundary
             if end < len(text):
-                # Look for sentence ending (., !, ?) near the chunk boundary
-                for i in range(end, max(start + chunk_size - 100, start), -1):
-                    if text[i] in '.!?' and i + 1 < len(text) and text[i + 1].isspace():
-                        end = i + 1
-                        break
+                # Look for sentence ending (., !, ?) near the chunk boundary;
+                # str.rfind scans in C instead of a per-character Python loop
+                lo = max(start + chunk_size - 100, start) + 1
+                best = max(text.rfind(b, lo, end + 2) for b in _SENTENCE_BREAKS)
+                if best >= lo:
+                    end = best + 1
             
             chunks.append(text[start:end].strip())
             start = end - overlap
@@ -178,12 +415,15 @@ class JournalRAG:
         Returns:
             List of search results with text and metadata
         """
-        if self.collection.count() == 0:
+        if self._count == 0:
+            # May be stale if another process has ingested since
+            self._count = self.collection.count()
+        if self._count == 0:
             print("Database is empty. Ingest entries first with --ingest")
             return []
         
         results = self.collection.query(
-            query_texts=[query],
+            query_embeddings=[list(_embed_query(self.embedder, query))],
             n_results=n_results
         )
         
@@ -222,7 +462,7 @@ class JournalRAG:
         
         if query:
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[list(_embed_query(self.embedder, query))],
                 n_results=n_results,
                 where=where_filter
             )
@@ -247,13 +487,27 @@ class JournalRAG:
         
         return formatted_results
     
+    def _memoized(self, name: str, compute):
+        """
+        Return compute()'s result, cached until this instance adds or
+        deletes chunks, or the chunk count changes underneath it (e.g.
+        another process ingesting). Callers get a copy they may modify.
+        """
+        key = (self._version, self.collection.count())
+        hit = self._memo.get(name)
+        if hit is None or hit[0] != key:
+            hit = self._memo[name] = (key, compute())
+        return copy.deepcopy(hit[1])
+    
     def get_all_dates(self) -> List[str]:
         """Get all unique dates in the database"""
-        all_entries = self.collection.get()
-        dates = set()
-        for metadata in all_entries['metadatas']:
-            dates.add(metadata['date'])
-        return sorted(list(dates))
+        return self._memoized("dates", self._compute_all_dates)
+    
+    def _compute_all_dates(self) -> List[str]:
+        metadatas = self.collection.get(include=["metadatas"])['metadatas']
+        # np.unique sorts and de-duplicates in C
+        dates = np.array([m['date'] for m in metadatas], dtype=str)
+        return np.unique(dates).tolist()
     
     def backup(self, reason: str = "manual") -> Path:
         """Create a timestamped backup of the vector database.
@@ -270,7 +524,11 @@ class JournalRAG:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = backup_dir / f"backup_{timestamp}_{reason}"
 
-        shutil.copytree(self.db_path, backup_path)
+        previous = [p for p in backup_dir.iterdir()
+                    if p.is_dir() and p.name.startswith("backup_")]
+        previous = max(previous, key=lambda p: p.stat().st_mtime, default=None)
+        _snapshot(self.db_path, backup_path, previous)
+        (backup_path / _SIZE_FILE).write_text(str(_dir_size(backup_path)))
         print(f"Backup created: {backup_path}")
 
         # Keep only the 5 most recent backups
@@ -294,12 +552,24 @@ class JournalRAG:
         backups = []
         for p in sorted(backup_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
             if p.is_dir() and p.name.startswith("backup_"):
-                size_bytes = sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
+                created = p.stat().st_mtime
+                size_file = p / _SIZE_FILE
+                try:
+                    size_bytes = int(size_file.read_text())
+                except (OSError, ValueError):
+                    # Older backup: measure once and remember it, keeping
+                    # the directory's mtime (used as its creation time)
+                    size_bytes = _dir_size(p)
+                    try:
+                        size_file.write_text(str(size_bytes))
+                        os.utime(p, (created, created))
+                    except OSError:
+                        pass
                 backups.append({
                     "path": str(p),
                     "name": p.name,
                     "size_mb": round(size_bytes / (1024 * 1024), 1),
-                    "created": datetime.fromtimestamp(p.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                    "created": datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S"),
                 })
         return backups
 
@@ -317,27 +587,76 @@ class JournalRAG:
             print(f"Backup not found: {backup_path}")
             return False
 
-        # Remove current DB
-        if self.db_path.exists():
-            shutil.rmtree(self.db_path)
+        # Copy the backup next to the current DB first, so a failed copy
+        # leaves the database untouched
+        staging = self.db_path.with_name(self.db_path.name + ".restoring")
+        if staging.exists():
+            shutil.rmtree(staging)
+        shutil.copytree(backup, staging,
+                        ignore=shutil.ignore_patterns(_SIZE_FILE))
 
-        # Copy backup to DB path
-        shutil.copytree(backup, self.db_path)
+        # Close Chroma's handles on the current files before moving them:
+        # Windows can't move open files, and elsewhere the new client
+        # would reuse the cached connection to the replaced database.
+        # Other JournalRAGs on this database reconnect on their next use.
+        self._close_client()
+        _restore_generation[self._db_key] = _restore_generation.get(self._db_key, 0) + 1
+
+        # Swap the restored copy into place, putting the current database
+        # back if that fails (e.g. a file still open elsewhere on Windows)
+        retired = self.db_path.with_name(self.db_path.name + ".replaced")
+        if retired.exists():
+            shutil.rmtree(retired)
+        try:
+            if self.db_path.exists():
+                os.replace(self.db_path, retired)
+            try:
+                os.replace(staging, self.db_path)
+            except OSError:
+                if retired.exists() and not self.db_path.exists():
+                    os.replace(retired, self.db_path)
+                raise
+        except OSError as e:
+            shutil.rmtree(staging, ignore_errors=True)
+            self._connect()
+            print(f"Restore failed, database left unchanged: {e}")
+            return False
+        shutil.rmtree(retired, ignore_errors=True)
 
         # Reinitialize client
-        self.client = chromadb.PersistentClient(
-            path=str(self.db_path),
-            settings=Settings(anonymized_telemetry=False)
-        )
-        self.collection = self.client.get_or_create_collection(
-            name="journal_entries",
-            metadata={"description": "Personal journal entries"}
-        )
+        self._connect()
+        self._version += 1
+        self._count = self.collection.count()
 
         print(f"Restored from backup: {backup_path}")
-        print(f"  Entries in database: {self.collection.count()}")
+        print(f"  Entries in database: {self._count}")
         return True
 
+    def _close_client(self):
+        """Shut down the Chroma system behind this database and release
+        its open files.
+        
+        Chroma shares one system (SQLite connection, HNSW index) between
+        all clients on the same path for the life of the process. Only
+        this path's system is stopped; clear_system_cache() would stop
+        every client in the process, on any database.
+        """
+        # (sic: Chroma's spelling)
+        systems = getattr(type(self.client), "_identifer_to_system", None)
+        identifier = getattr(self.client, "_identifier", None)
+        if isinstance(systems, dict) and identifier in systems:
+            systems.pop(identifier).stop()
+        else:
+            # Chroma's internals have moved. Stopping everything is better
+            # than reconnecting to a cached system on swapped-out files.
+            print("Warning: could not find this database's Chroma system; "
+                  "clearing Chroma's whole system cache instead")
+            clear_cache = getattr(self.client, "clear_system_cache", None)
+            if clear_cache is not None:
+                clear_cache()
+        self.client = self._collection = None
+        gc.collect()
+
     def delete_entry_by_date(self, date: str) -> int:
         """
         Delete all chunks from a specific date
@@ -348,18 +667,23 @@ class JournalRAG:
         Returns:
             Number of chunks deleted
         """
-        self.backup(reason="pre-delete")
         # Get all IDs for this date
         results = self.collection.get(
-            where={"date": date}
+            where={"date": date},
+            include=[]
         )
         
         if not results['ids']:
             print(f"No entries found for date: {date}")
             return 0
         
+        # Only back up when something is actually about to be deleted
+        self.backup(reason="pre-delete")
+        
         # Delete all chunks for this date
         self.collection.delete(ids=results['ids'])
+        self._version += 1
+        self._count -= len(results['ids'])
         
         deleted_count = len(results['ids'])
         print(f"Deleted {deleted_count} chunks from {date}")
@@ -376,17 +700,30 @@ class JournalRAG:
         Returns:
             True if deleted, False if not found
         """
-        self.backup(reason="pre-delete")
-        # Get all chunks that start with this ID
-        all_entries = self.collection.get()
-        matching_ids = [id for id in all_entries['ids'] if id.startswith(entry_id)]
+        if _DATE_RE.fullmatch(entry_id):
+            # IDs are "{date}_chunk_{i}", so the chunks whose ID starts with
+            # a date are those of every stored date starting with it (the
+            # date itself and suffixed stems like "2026-01-31_p2"), and
+            # Chroma fetches all their IDs in one query
+            dates = [d for d in self.get_all_dates() if d.startswith(entry_id)]
+            matching_ids = self.collection.get(
+                where={"date": {"$in": dates}}, include=[]
+            )['ids'] if dates else []
+        else:
+            # Get all chunks that start with this ID (IDs only)
+            all_entries = self.collection.get(include=[])
+            matching_ids = [id for id in all_entries['ids'] if id.startswith(entry_id)]
         
         if not matching_ids:
             print(f"No entry found with ID: {entry_id}")
             return False
         
+        self.backup(reason="pre-delete")
+        
         # Delete all matching chunks
         self.collection.delete(ids=matching_ids)
+        self._version += 1
+        self._count -= len(matching_ids)
         
         print(f"Deleted {len(matching_ids)} chunks for entry: {entry_id}")
         return True
@@ -399,9 +736,7 @@ class JournalRAG:
         Returns:
             Number of entries deleted
         """
-        # Get all IDs
-        all_entries = self.collection.get()
-        total = len(all_entries['ids'])
+        total = self.collection.count()
         
         if total == 0:
             print("Database is already empty")
@@ -409,8 +744,10 @@ class JournalRAG:
 
         self.backup(reason="pre-clear")
 
-        # Delete everything
-        self.collection.delete(ids=all_entries['ids'])
+        # Delete everything (fetching IDs only)
+        self.collection.delete(ids=self.collection.get(include=[])['ids'])
+        self._version += 1
+        self._count = 0
         
         print(f"Deleted all {total} entries from database")
         return total
@@ -422,25 +759,27 @@ class JournalRAG:
         Returns:
             List of entries with dates and IDs
         """
-        all_entries = self.collection.get()
+        return self._memoized("entries", self._compute_entries)
+    
+    def _compute_entries(self) -> List[Dict]:
+        metadatas = self.collection.get(include=["metadatas"])['metadatas']
         
-        # Group by date
-        entries_by_date = {}
-        for i, entry_id in enumerate(all_entries['ids']):
-            date = all_entries['metadatas'][i]['date']
-            if date not in entries_by_date:
-                entries_by_date[date] = {
-                    'date': date,
-                    'chunks': 0,
-                    'word_count': all_entries['metadatas'][i].get('word_count', 0)
-                }
-            entries_by_date[date]['chunks'] += 1
+        # Group by date: Counter tallies chunks in C, and iterating in
+        # reverse lets the first chunk seen for a date supply its word count
+        chunks = Counter(m['date'] for m in metadatas)
+        word_counts = {m['date']: m.get('word_count', 0) for m in reversed(metadatas)}
         
-        return sorted(entries_by_date.values(), key=lambda x: x['date'])
+        return [
+            {'date': date, 'chunks': chunks[date], 'word_count': word_counts[date]}
+            for date in sorted(chunks)
+        ]
     
     def get_stats(self) -> Dict:
-        """Get database statistics"""
-        all_entries = self.collection.get()
+        """Get database statistics (cached, see _memoized)"""
+        return self._memoized("stats", self._compute_stats)
+    
+    def _compute_stats(self) -> Dict:
+        all_entries = self.collection.get(include=["metadatas"])
         
         dates = []
         total_words = 0
@@ -463,6 +802,67 @@ class JournalRAG:
         }
 
 
+def _content_hash(text: str) -> str:
+    """Short, stable fingerprint of a chunk's text (stored in its metadata)."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def _dir_size(path: Path) -> int:
+    """Total size in bytes of the files under *path* (symlinks not followed)."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.lstat(os.path.join(root, name)).st_size
+    return total
+
+
+def _snapshot(src: Path, dst: Path, previous: Optional[Path] = None):
+    """Copy the directory *src* to *dst*, rsync --link-dest style.
+
+    Files whose size and mtime match the same file in the *previous*
+    snapshot are hardlinked to it instead of copied, so successive backups
+    only take space for what changed. The live database is never linked
+    (SQLite and the HNSW index are rewritten in place), only earlier
+    backups, which are never modified. Falls back to a plain copy wherever
+    hardlinks aren't supported.
+    """
+    def copy(src_file, dst_file):
+        if previous is not None:
+            old = previous / Path(src_file).relative_to(src)
+            try:
+                new_stat, old_stat = os.stat(src_file), os.stat(old)
+                if (new_stat.st_size == old_stat.st_size
+                        and new_stat.st_mtime_ns == old_stat.st_mtime_ns):
+                    os.link(old, dst_file)
+                    return dst_file
+            except OSError:
+                pass
+        # copy2 keeps the mtime, so the next snapshot can compare against it
+        return shutil.copy2(src_file, dst_file)
+
+    shutil.copytree(src, dst, copy_function=copy)
+
+
+@functools.lru_cache(maxsize=1)
+def _ollama_session():
+    """HTTP session shared by every OllamaLLM, so keep-alive reuses the
+    connection across questions (the dashboard creates an OllamaLLM per
+    chat message)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
+
+
 class OllamaLLM:
     """Interface to local Ollama LLM for Q&A"""
     
@@ -478,7 +878,7 @@ class OllamaLLM:
         # Check if Ollama is available
         try:
             import requests
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
+            response = _ollama_session().get("http://localhost:11434/api/tags", timeout=2)
             if response.status_code != 200:
                 raise ConnectionError("Ollama not responding")
             
@@ -510,8 +910,20 @@ class OllamaLLM:
         Returns:
             Generated answer
         """
-        import requests
+        return "".join(self.generate_stream(prompt, context))
+    
+    def generate_stream(self, prompt: str, context: List[str]) -> Iterator[str]:
+        """
+        Like generate(), but yields the answer piece by piece as Ollama
+        produces it, so callers can show output before it is complete
         
+        Args:
+            prompt: User's question
+            context: Relevant journal excerpts
+            
+        Yields:
+            Fragments of the generated answer
+        """
         # Build prompt with context
         context_str = "\n\n".join([f"Journal Entry:\n{c}" for c in context])
         
@@ -523,21 +935,30 @@ Question: {prompt}
 
 Answer based only on the journal entries provided above. If the entries don't contain enough information to answer, say so."""
         
-        # Call Ollama API
-        response = requests.post(
+        # Call Ollama API; with streaming, the timeout applies between
+        # chunks rather than to the whole answer
+        with _ollama_session().post(
             "http://localhost:11434/api/generate",
             json={
                 "model": self.model,
                 "prompt": full_prompt,
-                "stream": False
+                "stream": True
             },
+            stream=True,
             timeout=60
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"Ollama API error: {response.text}")
-        
-        return response.json()['response']
+        ) as response:
+            if response.status_code != 200:
+                raise Exception(f"Ollama API error: {response.text}")
+            
+            # One JSON object per line, the last one marked "done"
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line) if orjson is not None else json.loads(line)
+                if chunk.get('response'):
+                    yield chunk['response']
+                if chunk.get('done'):
+                    break
 
 
 def interactive_search(rag: JournalRAG, use_llm: bool = False, llm_model: str = "llama3.3"):
@@ -617,8 +1038,9 @@ def interactive_search(rag: JournalRAG, use_llm: bool = False, llm_model: str =
                 context = [r['text'] for r in results]
                 
                 print("\nThinking...\n")
-                answer = llm.generate(question, context)
-                print(f"{answer}\n")
+                for piece in llm.generate_stream(question, context):
+                    print(piece, end="", flush=True)
+                print("\n")
             
             elif command == 'dates':
                 dates = rag.get_all_dates()
@@ -696,6 +1118,12 @@ def main():
     ingest_parser.add_argument('ocr_output', help='Path to OCR output directory')
     ingest_parser.add_argument('--db', default='./vector_db', help='Database path')
     ingest_parser.add_argument('--chunk-size', type=int, default=500, help='Chunk size')
+    ingest_parser.add_argument('--hnsw-m', type=int,
+                               help=f"HNSW links per node for a new database (default: {HNSW_DEFAULTS['M']})")
+    ingest_parser.add_argument('--hnsw-construction-ef', type=int,
+                               help=f"HNSW build-time candidate list size (default: {HNSW_DEFAULTS['construction_ef']})")
+    ingest_parser.add_argument('--hnsw-search-ef', type=int,
+                               help=f"HNSW query-time candidate list size (default: {HNSW_DEFAULTS['search_ef']})")
     
     # Search command
     search_parser = subparsers.add_parser('search', help='Search journal entries')
@@ -748,7 +1176,14 @@ def main():
         return 1
     
     # Initialize RAG system
-    rag = JournalRAG(db_path=args.db)
+    hnsw = None
+    if args.command == 'ingest':
+        hnsw = {key: value for key, value in (
+            ("M", args.hnsw_m),
+            ("construction_ef", args.hnsw_construction_ef),
+            ("search_ef", args.hnsw_search_ef),
+        ) if value is not None}
+    rag = JournalRAG(db_path=args.db, hnsw=hnsw)
     
     if args.command == 'ingest':
         rag.ingest_from_ocr(args.ocr_output, chunk_size=args.chunk_size)
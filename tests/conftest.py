@@ -1,7 +1,9 @@
 import sys
 from pathlib import Path
 
+# Make the app, RAG and OCR modules importable from every test module.
+# pytest loads this once per session, before collecting the tests.
 ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT))
-sys.path.insert(0, str(ROOT / "rag"))
-sys.path.insert(0, str(ROOT / "ocr"))
+for path in (ROOT, ROOT / "rag", ROOT / "ocr"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -1,14 +1,10 @@
 """Tests for OCR pipeline (ocr/journal_ocr.py)."""
-import sys
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT / "ocr"))
-
+import cv2
 import pytest
 import numpy as np
 
-from journal_ocr import ImagePreprocessor, OCREngine, JournalOCRPipeline
+from journal_ocr import ImagePreprocessor, OCREngine, JournalOCRPipeline, _count_words_chars
+from auto_ocr_watcher import JournalPhotoHandler
 
 
 class TestImagePreprocessor:
@@ -23,6 +19,22 @@ class TestImagePreprocessor:
         angle = ImagePreprocessor._get_skew_angle(img)
         assert isinstance(angle, float)
 
+    def test_preprocess_blank_page(self, tmp_path):
+        path = tmp_path / "blank.png"
+        cv2.imwrite(str(path), np.full((800, 600), 250, dtype=np.uint8))
+        result = ImagePreprocessor.preprocess(str(path))
+        assert (result == 255).all()
+
+    def test_preprocess_sparse_text_not_blank(self, tmp_path):
+        # Well over 95% white paper, but one line of writing
+        img = np.full((800, 600), 250, dtype=np.uint8)
+        cv2.putText(img, "a few words", (50, 400), cv2.FONT_HERSHEY_SIMPLEX,
+                    1.0, 20, 2)
+        path = tmp_path / "sparse.png"
+        cv2.imwrite(str(path), img)
+        result = ImagePreprocessor.preprocess(str(path))
+        assert (result == 0).any()
+
     def test_rotate_image_preserves_shape(self):
         img = np.zeros((100, 200), dtype=np.uint8)
         rotated = ImagePreprocessor._rotate_image(img, 5.0)
@@ -44,6 +56,10 @@ class TestOCREngine:
             engine = OCREngine(engine="invalid_engine")
             engine.extract_text(np.zeros((10, 10), dtype=np.uint8))
 
+    def test_blank_image_skips_ocr(self):
+        engine = OCREngine(engine="tesseract")
+        assert engine.extract_text(np.full((50, 50), 255, dtype=np.uint8)) == ""
+
 
 class TestPipeline:
     def test_init_creates_directories(self, tmp_path):
@@ -64,3 +80,30 @@ class TestPipeline:
         empty_dir.mkdir()
         results = pipeline.process_batch(str(empty_dir))
         assert results == []
+
+
+class TestExtractDateFromFilename:
+    @pytest.mark.parametrize("filename", [
+        "IMG_2026-01-31.jpg", "journal_2026_01_31.jpg", "20260131.jpg",
+    ])
+    def test_supported_formats(self, filename):
+        handler = JournalPhotoHandler(pipeline=None)
+        assert handler._extract_date_from_filename(filename) == "2026-01-31"
+
+    def test_no_date(self):
+        handler = JournalPhotoHandler(pipeline=None)
+        assert handler._extract_date_from_filename("IMG_0001.jpg") is None
+        assert handler._extract_date_from_filename("photo.heic") is None
+
+
+class TestCountWordsChars:
+    @pytest.mark.parametrize("text", [
+        "",
+        "one",
+        "  leading and trailing  ",
+        "tabs\tand\nnewlines\r\nmixed\x0bvertical\x1cseparators",
+        "word " * 2000,  # long enough for the JIT path when numba is installed
+        "café naïve " * 1000,  # non-ASCII always uses str.split()
+    ])
+    def test_matches_str_split(self, text):
+        assert _count_words_chars(text) == (len(text.split()), len(text))
@@ -1,10 +1,10 @@
 """Tests for the plugin loader system."""
-import sys
+import copy
+import dataclasses
+import os
+import pickle
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT))
-
 import pytest
 import pandas as pd
 from plugin_loader import register, discover_plugins, PluginContext, PluginInfo, _registry
@@ -103,6 +103,26 @@ class TestDiscoverPlugins:
         assert plugins[0].name == "A Plugin"
         assert plugins[1].name == "Z Plugin"
 
+    def test_reuses_loaded_plugins_until_files_change(self, tmp_path):
+        log = tmp_path / "exec.log"
+        plugin_file = tmp_path / "counted.py"
+        plugin_file.write_text(
+            "from plugin_loader import register\n\n"
+            f"with open({str(log)!r}, 'a') as f:\n"
+            "    f.write('x')\n\n"
+            '@register("Counted")\n'
+            "def render(ctx): pass\n",
+            encoding="utf-8",
+        )
+        assert [p.name for p in discover_plugins(tmp_path)] == ["Counted"]
+        assert [p.name for p in discover_plugins(tmp_path)] == ["Counted"]
+        assert log.read_text() == "x"
+
+        stat = plugin_file.stat()
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert [p.name for p in discover_plugins(tmp_path)] == ["Counted"]
+        assert log.read_text() == "xx"
+
 
 class TestPluginContext:
     def test_instantiation(self):
@@ -119,3 +139,37 @@ class TestPluginContext:
         )
         assert ctx.rag_db_path == "/tmp/db"
         assert ctx.df.empty
+
+    def test_read_only(self):
+        ctx = PluginContext(
+            df=pd.DataFrame(),
+            rag_db_path="/tmp/db",
+            root=Path("/tmp"),
+            session_log=lambda msg: None,
+            section_header=lambda t, h: None,
+            extract_common_words=lambda texts, n_words=30: [],
+            get_sentiment=lambda text: 0.0,
+            get_rag=lambda db: None,
+            load_theme=lambda: {},
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ctx.rag_db_path = "/elsewhere"
+        assert not hasattr(ctx, "__dict__")
+
+    def test_copy_and_pickle_round_trip(self):
+        ctx = PluginContext(
+            df=pd.DataFrame({"text": ["entry"]}),
+            rag_db_path="/tmp/db",
+            root=Path("/tmp"),
+            session_log=print,
+            section_header=print,
+            extract_common_words=sorted,
+            get_sentiment=len,
+            get_rag=str,
+            load_theme=dict,
+        )
+        for clone in (copy.copy(ctx), copy.deepcopy(ctx),
+                      pickle.loads(pickle.dumps(ctx))):
+            assert clone.rag_db_path == "/tmp/db"
+            assert clone.get_sentiment is len
+            assert clone.df.equals(ctx.df)
@@ -1,19 +1,30 @@
 """Tests for the JournalRAG system (rag/journal_rag.py)."""
-import sys
 import json
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT / "rag"))
+import shutil
 
 import pytest
 from journal_rag import JournalRAG
 
 
+@pytest.fixture(scope="module")
+def shared_rag(tmp_path_factory):
+    """One JournalRAG with a temporary database per test module (opening
+    the Chroma client is the slow part)."""
+    return JournalRAG(db_path=str(tmp_path_factory.mktemp("rag") / "test_db"))
+
+
 @pytest.fixture
-def rag(tmp_path):
-    """Create a JournalRAG instance with a temporary database."""
-    return JournalRAG(db_path=str(tmp_path / "test_db"))
+def rag(shared_rag):
+    """The module's JournalRAG, emptied again after each test."""
+    yield shared_rag
+    shared_rag.clear_all_entries()
+    shutil.rmtree(shared_rag.db_path.parent / "vector_db_backups", ignore_errors=True)
+
+
+class TestInit:
+    def test_unknown_embedding_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            JournalRAG(db_path=str(tmp_path / "db"), embedding_backend="tpu")
 
 
 class TestChunkText:
@@ -65,6 +76,11 @@ class TestEmptyDatabase:
     def test_clear_empty(self, rag):
         assert rag.clear_all_entries() == 0
 
+    def test_delete_nonexistent_makes_no_backup(self, rag):
+        rag.delete_entry_by_date("2025-01-01")
+        rag.delete_entry_by_id("2025-01-01")
+        assert rag.list_backups() == []
+
 
 class TestIngest:
     """Tests for ingestion functionality."""
@@ -113,3 +129,92 @@ class TestIngest:
         rag.ingest_from_ocr(str(tmp_path / "ocr_out"))
         results = rag.search("hiking mountains")
         assert len(results) >= 1
+
+    def test_stats_refresh_after_ingest_and_delete(self, rag, tmp_path):
+        assert rag.get_stats()["total_chunks"] == 0
+        text_dir = tmp_path / "ocr_out" / "text"
+        meta_dir = tmp_path / "ocr_out" / "metadata"
+        text_dir.mkdir(parents=True)
+        meta_dir.mkdir(parents=True)
+        (text_dir / "2025-03-01.txt").write_text("A quiet day.", encoding="utf-8")
+        (meta_dir / "2025-03-01.json").write_text(
+            json.dumps({
+                "entry_date": "2025-03-01",
+                "word_count": 3,
+                "source_file": "q.jpg",
+            }),
+            encoding="utf-8",
+        )
+        rag.ingest_from_ocr(str(tmp_path / "ocr_out"))
+        assert rag.get_stats()["total_entries"] == 1
+        rag.delete_entry_by_date("2025-03-01")
+        assert rag.get_stats()["total_entries"] == 0
+
+    def test_delete_by_id_includes_suffixed_stems(self, rag, tmp_path):
+        text_dir = tmp_path / "ocr_out" / "text"
+        meta_dir = tmp_path / "ocr_out" / "metadata"
+        text_dir.mkdir(parents=True)
+        meta_dir.mkdir(parents=True)
+        for stem in ("2025-05-01", "2025-05-01_p2", "2025-05-02"):
+            (text_dir / f"{stem}.txt").write_text(f"Page {stem}.", encoding="utf-8")
+            (meta_dir / f"{stem}.json").write_text(
+                json.dumps({
+                    "entry_date": stem,
+                    "word_count": 2,
+                    "source_file": f"{stem}.jpg",
+                }),
+                encoding="utf-8",
+            )
+        rag.ingest_from_ocr(str(tmp_path / "ocr_out"))
+        assert rag.delete_entry_by_id("2025-05-01")
+        assert rag.get_all_dates() == ["2025-05-02"]
+
+
+class TestBackup:
+    """Tests for backup and restore."""
+
+    def test_restore_brings_back_deleted_entry(self, rag, tmp_path):
+        text_dir = tmp_path / "ocr_out" / "text"
+        meta_dir = tmp_path / "ocr_out" / "metadata"
+        text_dir.mkdir(parents=True)
+        meta_dir.mkdir(parents=True)
+        (text_dir / "2025-04-01.txt").write_text("Spring at last.", encoding="utf-8")
+        (meta_dir / "2025-04-01.json").write_text(
+            json.dumps({
+                "entry_date": "2025-04-01",
+                "word_count": 3,
+                "source_file": "s.jpg",
+            }),
+            encoding="utf-8",
+        )
+        rag.ingest_from_ocr(str(tmp_path / "ocr_out"))
+        backup_path = rag.backup(reason="test")
+        rag.delete_entry_by_date("2025-04-01")
+        assert rag.get_all_dates() == []
+
+        assert rag.restore(str(backup_path))
+        assert rag.get_all_dates() == ["2025-04-01"]
+        assert not (rag.db_path.parent / "test_db.restoring").exists()
+
+    def test_restore_reconnects_other_instances(self, rag, tmp_path):
+        text_dir = tmp_path / "ocr_out" / "text"
+        meta_dir = tmp_path / "ocr_out" / "metadata"
+        text_dir.mkdir(parents=True)
+        meta_dir.mkdir(parents=True)
+        (text_dir / "2025-04-02.txt").write_text("Rain all day.", encoding="utf-8")
+        (meta_dir / "2025-04-02.json").write_text(
+            json.dumps({
+                "entry_date": "2025-04-02",
+                "word_count": 3,
+                "source_file": "r.jpg",
+            }),
+            encoding="utf-8",
+        )
+        rag.ingest_from_ocr(str(tmp_path / "ocr_out"))
+        backup_path = rag.backup(reason="test")
+        rag.delete_entry_by_date("2025-04-02")
+
+        # e.g. the dashboard's cached instance on the same database
+        other = JournalRAG(db_path=str(rag.db_path))
+        assert rag.restore(str(backup_path))
+        assert other.get_all_dates() == ["2025-04-02"]